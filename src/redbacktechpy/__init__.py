@@ -1,6 +1,10 @@
 from .constants import (
     TIMEOUT,
     DEVICEINFOREFRESH,
+    SCHEDULEREFRESH,
+    POLLINTERVAL,
+    POLLINTERVALMAX,
+    MAXCONCURRENTREQUESTS,
     AUTH_ERROR_CODES,
     BaseUrl,
     Endpoint,
@@ -16,4 +20,4 @@ from .model import (Inverters, Batterys, DeviceInfo)
 from .str_enum import StrEnum
 
 
-__all__ = ['TIMEOUT','DEVICEINFOREFRESH','AUTH_ERROR_CODES','BaseUrl','Endpoint','InverterOperationType','InverterModeControl','Header','DeviceTypes','DeviceInfo']
\ No newline at end of file
+__all__ = ['TIMEOUT','DEVICEINFOREFRESH','SCHEDULEREFRESH','POLLINTERVAL','POLLINTERVALMAX','MAXCONCURRENTREQUESTS','AUTH_ERROR_CODES','BaseUrl','Endpoint','InverterOperationType','InverterModeControl','Header','DeviceTypes','DeviceInfo']
\ No newline at end of file
@@ -4,6 +4,16 @@ TIMEOUT = 5 * 60
 DEVICEINFOREFRESH = (
     30 * 60
 )  # Number of seconds to wait before refreshing device info as it doesn't change very often
+SCHEDULEREFRESH = (
+    10 * 60
+)  # Number of seconds to reuse inverter schedules, they are refetched straight away after we change them
+POLLINTERVAL = 60  # Suggested seconds between get_redback_data calls while the data is changing
+POLLINTERVALMAX = 5 * 60  # Longest suggested poll interval when the data stops changing
+POLLBACKOFF = 1.5  # Factor the suggested poll interval grows by each time the data is unchanged
+MAXCONCURRENTREQUESTS = 10  # Most API requests allowed in flight at once
+RETRYATTEMPTS = 3  # Attempts made at an idempotent API request before giving up on a transient error
+RETRYBACKOFF = 0.5  # Seconds to wait before the first retry, doubled for each one after
+RETRY_STATUSES = frozenset({502, 503, 504})  # Gateway statuses worth retrying
 
 OAUTH_SCOPE = "api://f0ea23e1-8533-44ab-8592-509cff0774da/.default"
 OAUTH_GRANT_TYPE = "client_credentials"
@@ -0,0 +1,21 @@
+"""Entity builders for Redback Tech API"""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+def cabinet_entities(cabinets: list[dict[str, Any]], device_id: str, device_type: str) -> list[dict[str, Any]]:
+    """Build the temperature and fan state entities for each battery cabinet."""
+    entities: list[dict[str, Any]] = []
+    append_entity = entities.append
+    for cabinet_id, cabinet in enumerate(cabinets, 1):
+        cabinet_prefix: str = f'battery_cabinet_{cabinet_id}_'
+        append_entity({'value': cabinet['TemperatureC'],'entity_name': cabinet_prefix + 'temperature_c', 'device_id': device_id, 'device_type': device_type})
+        append_entity({'value': cabinet['FanState'],'entity_name': cabinet_prefix + 'fan_state', 'device_id': device_id, 'device_type': device_type})
+    return entities
+
+
+def site_load_entity(site_load_data: float, device_id: str, device_type: str) -> dict[str, Any]:
+    """Build the site load entity, rounded to watts."""
+    return {'value': round(site_load_data,3),'entity_name': 'inverter_site_load_instantaneous_kw', 'device_id': device_id, 'device_type': device_type}
@@ -7,7 +7,7 @@ import datetime
 from typing import Any, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class RedbackTechData:
     """Dataclass for all RedbackTech Data."""
 
@@ -25,7 +25,7 @@ class RedbackTechData:
     envelope_calendar: Optional[dict[int, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Site:
     """Dataclass for Redback Sites."""
 
@@ -34,7 +34,7 @@ class Site:
     type: str
 
 
-@dataclass
+@dataclass(slots=True)
 class RedbackEntitys:
     entity_id: str
     device_id: str
@@ -43,7 +43,7 @@ class RedbackEntitys:
     device_data: Optional[dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Inverters:
     """Dataclass for Redback Inverters."""
 
@@ -53,7 +53,7 @@ class Inverters:
     type: str
 
 
-@dataclass
+@dataclass(slots=True)
 class OpEnvelopes:
     """Dataclass for Redback Inverters."""
 
@@ -62,7 +62,7 @@ class OpEnvelopes:
     data: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class Batterys:
     """Dataclass for RedBack Batteries."""
 
@@ -72,7 +72,7 @@ class Batterys:
     type: str
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceInfo:
     """Dataclass for Device Info."""
 
@@ -84,7 +84,7 @@ class DeviceInfo:
     serial_number: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Numbers:
     """Dataclass for Redback Inverters."""
 
@@ -94,7 +94,7 @@ class Numbers:
     type: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ActiveSchedule:
     """Dataclass for Redback Inverters."""
 
@@ -104,7 +104,7 @@ class ActiveSchedule:
     type: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Buttons:
     """Dataclass for Redback Inverters."""
 
@@ -114,7 +114,7 @@ class Buttons:
     type: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Text:
     """Dataclass for Redback Inverters."""
 
@@ -123,7 +123,7 @@ class Text:
     data: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class Selects:
     """Dataclass for Redback Inverters."""
 
@@ -133,7 +133,7 @@ class Selects:
     type: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ScheduleDateTime:
     """Dataclass for Redback Inverters."""
 
@@ -143,7 +143,7 @@ class ScheduleDateTime:
     type: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ScheduleInfo:
     """Dataclass for Schedule Info."""
 
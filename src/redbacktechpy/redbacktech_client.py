@@ -1,13 +1,17 @@
 """Python API for Redback Tech Systems"""
 from __future__ import annotations
 from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 from typing import Any
 import re
 from math import sqrt
+from sys import intern
 import uuid
 import asyncio
+import ssl
 import logging
-from aiohttp import ClientResponse, ClientSession
+import orjson
+from aiohttp import ClientConnectionError, ClientResponse, ClientResponseError, ClientSession, ClientTimeout, TCPConnector
 from bs4 import BeautifulSoup
 
 from .constants import (
@@ -18,6 +22,14 @@ from .constants import (
     TIMEOUT,
     AUTH_ERROR_CODES,
     DEVICEINFOREFRESH,
+    SCHEDULEREFRESH,
+    POLLINTERVAL,
+    POLLINTERVALMAX,
+    POLLBACKOFF,
+    MAXCONCURRENTREQUESTS,
+    RETRYATTEMPTS,
+    RETRYBACKOFF,
+    RETRY_STATUSES,
     INVERTER_MODES,
     INVERTER_PORTAL_MODES,
     OAUTH_GRANT_TYPE,
@@ -40,38 +52,217 @@ from .exceptions import (
         AuthError,
         RedbackTechClientError,
 )
+from .entity_builders import (
+    cabinet_entities,
+    site_load_entity,
+)
 
 LOGGER = logging.getLogger(__name__)
 
+_LOGIN_FORM_RE = re.compile(r'<form\b[^>]*\sclass="[^"]*\blogin-form\b[^"]*"[^>]*>(.*?)</form>', re.S | re.I)
+_GAF_FORM_RE = re.compile(r'<form\b[^>]*\sid="GlobalAntiForgeryToken"[^>]*>(.*?)</form>', re.S | re.I)
+_HIDDEN_INPUT_RE = re.compile(r'<input\b[^>]*\stype="hidden"[^>]*>', re.I)
+_VALUE_ATTR_RE = re.compile(r'\svalue="([^"]*)"', re.I)
+#Inverter and battery entities use these as their device_type
+_INVERTER = 'inverter'
+_BATTERY = 'battery'
+_UTC = timezone.utc
+_UTCNOW = datetime.now
+_RETRY_METHODS = frozenset({'GET', 'DELETE'})
+_SQRT_PHASES = (0.0, 1.0, sqrt(2), sqrt(3))  # Indexed by phase count, the total voltage scales the mean by sqrt(phases)
+
+#(entity_name, section, key) specs for entities copied straight from a response, in the order they are listed
+_INVERTER_SENSOR_SPECS = (
+    ('model_name', 'node', 'ModelName'),
+    ('serial_number', 'node', 'Id'),
+    ('latitude', 'location', 'Latitude'),
+    ('longitude', 'location', 'Longitude'),
+)
+_INVERTER_STATIC_SPECS = (
+    ('network_connection', 'remote', 'Type'),
+    ('approved_capacity_w', 'site', 'ApprovedCapacityW'),
+    ('generation_hard_limit_va', 'details', 'GenerationHardLimitVA'),
+    ('generation_soft_limit_va', 'details', 'GenerationSoftLimitVA'),
+    ('export_hard_limit_kw', 'details', 'ExportHardLimitkW'),
+    ('export_soft_limit_kw', 'details', 'ExportSoftLimitkW'),
+    ('site_export_limit_kw', 'details', 'SiteExportLimitkW'),
+    ('pv_panel_model', 'details', 'PanelModel'),
+    ('pv_panel_size_kw', 'details', 'PanelSizekW'),
+    ('system_type', 'details', 'SystemType'),
+    ('inverter_max_export_power_kw', 'details', 'InverterMaxExportPowerkW'),
+    ('inverter_max_import_power_kw', 'details', 'InverterMaxImportPowerkW'),
+    ('commissioning_date', 'site', 'CommissioningDate'),
+    ('nmi', 'site', 'NMI'),
+    ('site_id', 'site', 'Id'),
+    ('inverter_site_type', 'site', 'Type'),
+    ('battery_count', 'node', 'BatteryCount'),
+    ('software_version', 'node', 'SoftwareVersion'),
+    ('firmware_version', 'node', 'FirmwareVersion'),
+)
+_INVERTER_DYNAMIC_SPECS = (
+    ('frequency_instantaneous', 'dynamic', 'FrequencyInstantaneousHz'),
+    ('pv_power_instantaneous_kw', 'dynamic', 'PvPowerInstantaneouskW'),
+    ('inverter_temperature_c', 'dynamic', 'InverterTemperatureC'),
+)
+_BATTERY_STATIC_SPECS = (
+    ('latitude', 'location', 'Latitude'),
+    ('longitude', 'location', 'Longitude'),
+    ('battery_max_charge_power_kw', 'details', 'BatteryMaxChargePowerkW'),
+    ('battery_max_discharge_power_kw', 'details', 'BatteryMaxDischargePowerkW'),
+    ('battery_capacity_kwh', 'details', 'BatteryCapacitykWh'),
+    ('battery_usable_capacity_kwh', 'details', 'UsableBatteryCapacitykWh'),
+    ('system_type', 'details', 'SystemType'),
+    ('commissioning_date', 'site', 'CommissioningDate'),
+    ('site_id', 'site', 'Id'),
+    ('inverter_site_type', 'site', 'Type'),
+    ('model_name', 'node', 'ModelName'),
+    ('battery_count', 'node', 'BatteryCount'),
+    ('software_version', 'node', 'SoftwareVersion'),
+    ('firmware_version', 'node', 'FirmwareVersion'),
+    ('inverter_serial_number', 'node', 'Id'),
+)
+_BATTERY_DYNAMIC_SPECS = (
+    ('status', 'dynamic', 'Status'),
+    ('battery_current_negative_is_charging_a', 'battery', 'CurrentNegativeIsChargingA'),
+    ('battery_voltage_v', 'battery', 'VoltageV'),
+    ('battery_voltage_type', 'battery', 'VoltageType'),
+    ('battery_no_of_modules', 'battery', 'NumberOfModules'),
+)
+#(response key, entity_name) for the all time kWh totals, reported in MWh
+_INVERTER_ALLTIME_SPECS = (
+    ('PvAllTimeEnergykWh', 'pv_all_time_energy_mwh'),
+    ('ExportAllTimeEnergykWh', 'export_all_time_energy_mwh'),
+    ('ImportAllTimeEnergykWh', 'import_all_time_energy_mwh'),
+    ('LoadAllTimeEnergykWh', 'load_all_time_energy_mwh'),
+)
+_BATTERY_ALLTIME_SPECS = (
+    ('BatteryChargeAllTimeEnergykWh', 'battery_charge_all_time_energy_mwh'),
+    ('BatteryDischargeAllTimeEnergykWh', 'battery_discharge_all_time_energy_mwh'),
+)
+#(entity_name, envelope key, type_set, value when no event is active) for the active operating envelope
+_OP_ENV_ACTIVE_SPECS = (
+    ('op_env_active_event_id', 'EventId', 'sensor.string', 'No Active Event'),
+    ('op_env_active_nmi', 'Nmi', 'sensor.string', None),
+    ('op_env_active_site_id', 'SiteId', 'sensor.string', None),
+    ('op_env_active_start_datetime', 'StartAtUtc', 'sensor.datetime', None),
+    ('op_env_active_end_datetime', 'EndAtUtc', 'sensor.datetime', None),
+    ('op_env_active_max_import_power_w', 'MaxImportPowerW', 'sensor.integer', 0),
+    ('op_env_active_max_export_power_w', 'MaxExportPowerW', 'sensor.integer', 0),
+    ('op_env_active_max_discharge_power_w', 'MaxDischargePowerW', 'sensor.integer', 0),
+    ('op_env_active_max_charge_power_w', 'MaxChargePowerW', 'sensor.integer', 0),
+    ('op_env_active_max_generation_power_va', 'MaxGenerationPowerVA', 'sensor.integer', 0),
+    ('op_env_active_is_network_level', 'IsNetworkLevel', 'sensor.boolean', None),
+    ('op_env_active_reported_start_datetime', 'ReportedStartUtc', 'sensor.datetime', None),
+    ('op_env_active_reported_finished_datetime', 'ReportedFinishUtc', 'sensor.datetime', None),
+    ('op_env_active_status', 'Status', 'sensor.string', None),
+)
+#(entity_name, envelope key, value when nothing is selected) for the selected operating envelope
+_SELECTED_OP_ENV_SPECS = (
+    ('op_env_selected_start_time', 'StartAtUtc', None),
+    ('op_env_selected_end_time', 'EndAtUtc', None),
+    ('op_env_selected_event_id', 'EventId', ''),
+    ('op_env_selected_nmi', 'Nmi', ''),
+    ('op_env_selected_site_id', 'SiteId', ''),
+    ('op_env_selected_max_import_power_w', 'MaxImportPowerW', 0),
+    ('op_env_selected_max_export_power_w', 'MaxExportPowerW', 0),
+    ('op_env_selected_max_discharge_power_w', 'MaxDischargePowerW', 0),
+    ('op_env_selected_max_charge_power_w', 'MaxChargePowerW', 0),
+    ('op_env_selected_max_generation_power_va', 'MaxGenerationPowerVA', 0),
+    ('op_env_selected_status', 'Status', ''),
+    ('op_env_selected_schedule_selector', 'schedule_selector', None),
+)
+#(entity_name, schedule key, value when nothing is selected) for the selected schedule
+_SELECTED_SCHEDULE_SPECS = (
+    ('scheduled_start_time', 'start_time_utc', None),
+    ('scheduled_finish_time', 'end_time', None),
+    ('scheduled_duration', 'duration', 0),
+    ('scheduled_power_w', 'power_w', 0),
+    ('scheduled_inverter_mode', 'inverter_mode', 'ChargeBattery'),
+)
+_SSL_CONTEXT: ssl.SSLContext | None = None
+
+def _ssl_context() -> ssl.SSLContext:
+    """Return the SSL context shared by every connector, loading the CA bundle only once."""
+    global _SSL_CONTEXT
+    if _SSL_CONTEXT is None:
+        _SSL_CONTEXT = ssl.create_default_context()
+    return _SSL_CONTEXT
+
+def _mppt_names(pv_id: int) -> tuple[str, ...]:
+    """Return the portal key and entity names for one MPPT."""
+    return (f'mppt_{pv_id}', f'mppt_{pv_id}_current_a', f'mppt_{pv_id}_voltage_v', f'mppt_{pv_id}_power_kw', f'mppt_{pv_id}_size_kw',
+            f'mppt_{pv_id}_generation_instant', f'mppt_{pv_id}_number_panels', f'mppt_{pv_id}_panel_direction')
+
+def _phase_names(phase_alpha: str) -> tuple[str, ...]:
+    """Return the entity names for one phase."""
+    return (f'inverter_phase_{phase_alpha}_active_exported_power_instantaneous_kw', f'inverter_phase_{phase_alpha}_active_imported_power_instantaneous_kw',
+            f'inverter_phase_{phase_alpha}_active_net_power_instantaneous_kw', f'inverter_phase_{phase_alpha}_voltage_instantaneous_v',
+            f'inverter_phase_{phase_alpha}_current_instantaneous_a', f'inverter_phase_{phase_alpha}_power_factor_instantaneous_minus_1to1')
+
+#Entity names are built once at import, unusual MPPT counts or phase ids fall back to the builders above
+_MPPT_NAMES = tuple(_mppt_names(pv_id) for pv_id in range(1, 17))
+_PHASE_NAMES = {phase_id: _phase_names(phase_id.lower()) for phase_id in ('A', 'B', 'C')}
+
 class RedbackTechClient:
     """Redback Tech Client"""
 
-    def __init__(self, client_id: str, client_secret:str, portal_email: str, portal_password: str, session1: ClientSession | None = None, session2: ClientSession | None = None, timeout: int = TIMEOUT, include_envelopes=True, debug_logging = False) -> None:
+    __slots__ = (
+        'client_id', 'client_secret', 'portal_email', 'portal_password', 'timeout', '_timeout',
+        'serial_numbers', '_connector', '_session1', '_session2', '_include_envelopes', 'token',
+        'token_type', 'token_expiration', '_auth_headers', '_auth_headers_json',
+        '_auth_headers_get', '_token_lock', '_api_sem', '_GAFToken', '_portal_lock',
+        '_device_info_refresh_time', '_redback_site_ids', '_redback_devices', '_redback_mppt_data',
+        '_redback_entities', '_entity_instances', '_redback_device_info',
+        '_redback_device_info_by_id', '_id_cache', '_redback_buttons', '_redback_numbers', '_redback_selects',
+        '_redback_text', '_redback_schedule_datetime', '_redback_schedules', '_schedules_by_device', '_schedules_by_selector',
+        '_redback_open_env_data', '_redback_site_load', '_inverter_control_settings',
+        '_redback_schedule_selected', '_redback_temp_voltage', '_redback_active_schedule',
+        '_serial_numbers', '_dynamic_data', '_static_cache', '_static_entities', '_static_refresh',
+        '_schedule_refresh', '_poll_interval_min', '_poll_interval_max', '_poll_interval',
+        '_dynamic_timestamps', '_http_cache', '_redback_op_env_data', '_redback_op_env_active',
+        '_redback_op_env_create_settings', '_redback_op_env_selected',
+    )
+
+    def __init__(self, client_id: str, client_secret:str, portal_email: str, portal_password: str, session1: ClientSession | None = None, session2: ClientSession | None = None, timeout: int = TIMEOUT, include_envelopes=True, debug_logging = False, max_concurrent_requests: int = MAXCONCURRENTREQUESTS) -> None:
         self.client_id: str = client_id
         self.client_secret: str = client_secret
         self.portal_email: str = portal_email
         self.portal_password: str = portal_password
         self.timeout: int = timeout
+        self._timeout: ClientTimeout = ClientTimeout(total=timeout, connect=min(10, timeout))
         self.serial_numbers: list[str] | None = None
-        self._session1: ClientSession = session1 if session1 else ClientSession()
-        self._session2: None # ClientSession = session2 if session2 else ClientSession()
+        self._connector: TCPConnector | None = None
+        self._session1: ClientSession = session1 if session1 else ClientSession(connector=self._create_connector(), connector_owner=False, timeout=self._timeout)
+        #The portal login clears its cookie jar, so it never runs on a caller's session
+        self._session2: ClientSession | None = None
         self._include_envelopes: bool = include_envelopes
         self.token: str | None = None
         self.token_type: str | None = None
         self.token_expiration: datetime | None = None
+        self._auth_headers: dict[str, str] = {}
+        self._auth_headers_json: dict[str, str] = {}
+        self._auth_headers_get: dict[str, str] = {}
+        self._token_lock: asyncio.Lock = asyncio.Lock()
+        self._api_sem: asyncio.Semaphore = asyncio.Semaphore(max_concurrent_requests)
         self._GAFToken: str | None = None
+        self._portal_lock: asyncio.Lock = asyncio.Lock()
         self._device_info_refresh_time: datetime | None = None
         self._redback_site_ids = []
         self._redback_devices = []
         self._redback_mppt_data = {}
         self._redback_entities = []
+        self._entity_instances: dict[str, RedbackEntitys] = {}
         self._redback_device_info = []
+        self._redback_device_info_by_id = {}
+        self._id_cache: dict[tuple[str, str], str] = {}
         self._redback_buttons = []
         self._redback_numbers = []
         self._redback_selects = []
         self._redback_text = []
         self._redback_schedule_datetime = []
         self._redback_schedules = []
+        self._schedules_by_device: dict[str, list[str]] = {}
+        self._schedules_by_selector: dict[str, dict[str, Any]] = {}
         self._redback_open_env_data = []
         self._redback_site_load = {}
         self._inverter_control_settings = {}
@@ -80,8 +271,15 @@ class RedbackTechClient:
         self._redback_active_schedule = {}
         self._serial_numbers = []
         self._dynamic_data = []
-        self._response1_data = {}
-        self._response1_data_timer ={}
+        self._static_cache: dict[tuple[str, str], tuple[datetime, dict[str, Any]]] = {}
+        self._static_entities: dict[str, tuple[dict[str, Any], list[dict[str, Any]]]] = {}
+        self._static_refresh: int = DEVICEINFOREFRESH
+        self._schedule_refresh: int = SCHEDULEREFRESH
+        self._poll_interval_min: float = POLLINTERVAL
+        self._poll_interval_max: float = POLLINTERVALMAX
+        self._poll_interval: float = POLLINTERVAL
+        self._dynamic_timestamps: dict[str, str] = {}
+        self._http_cache: dict[str, tuple[datetime, bytes]] = {}
         self._redback_op_env_data = {}
         self._redback_op_env_active = {}
         self._redback_op_env_create_settings = {}
@@ -97,66 +295,22 @@ class RedbackTechClient:
         if self._include_envelopes:
             await self._create_op_env_data()
 
-        op_envelope_data: dict[str, OpEnvelopes] = {}
-        text_data: dict[str, Text] = {}
-        entity_data: dict[str, RedbackEntitys] = {}
-        device_info_data: dict[str, DeviceInfo] = {}
-        button_data: dict[str, Buttons] = {}
-        selects_data: dict[str, Selects] = {}
-        numbers_data: dict[str, Numbers] = {}
-        schedules_data: dict[str, ScheduleInfo] = {}
-        schedules_datetime_data: dict[str, ScheduleDateTime] = {}
-
-        if self._redback_open_env_data is not None:
-            envelope_calendar_list = []
-            self._redback_open_env_data.sort(key = lambda x: x['data']['StartAtUtc'])
-            for op_env in self._redback_open_env_data:
-                op_instance, op_id = await self._handle_op_env(op_env)
-                op_envelope_data[op_id] = op_instance
-                envelope_calendar_list.append(await self._handle_envelope_calendar(op_env))
-
-        if self._redback_entities is not None:
-            for entity in self._redback_entities:
-                ent_instance, ent_id = await self._handle_entity(entity)
-                entity_data[ent_id] = ent_instance            
-
-        if self._redback_device_info is not None:
-            for device in self._redback_device_info:
-                device_instance, dev_id = await self._handle_device_info(device)
-                device_info_data[dev_id] = device_instance
-
-        if self._redback_buttons is not None:
-            for button in self._redback_buttons:
-                button_instance, button_id = await self._handle_button(button)
-                button_data[button_id] = button_instance
-
-        if self._redback_numbers is not None:
-            for number in self._redback_numbers:
-                number_instance, number_id = await self._handle_number(number)
-                numbers_data[number_id] = number_instance
-
-        if self._redback_text is not None:
-            for text in self._redback_text:
-                text_instance, text_id = await self._handle_text(text)
-                text_data[text_id] = text_instance
-
-        if self._redback_selects is not None:
-            for select in self._redback_selects:
-                select_instance, select_id = await self._handle_select(select)
-                selects_data[select_id] = select_instance
-
-        if self._redback_schedules is not None:
-            inverter_calendar_list = []
-            self._redback_schedules.sort(key = lambda x: x['start_time_utc'])
-            for schedule in self._redback_schedules:
-                schedule_instance, schedule_id = await self._handle_schedule(schedule)
-                schedules_data[schedule_id] = schedule_instance
-                inverter_calendar_list.append(await self._handle_inverter_calendar(schedule))
-
-        if self._redback_schedule_datetime is not None:
-            for schedule in self._redback_schedule_datetime:
-                schedule_instance, schedule_id = await self._handle_schedule_datetime(schedule)
-                schedules_datetime_data[schedule_id] = schedule_instance
+        self._redback_open_env_data.sort(key = lambda x: x['data']['StartAtUtc'])
+        self._redback_schedules.sort(key = lambda x: x['start_time_utc'])
+
+        #None of the handlers do any I/O so build each collection in a single pass
+        op_envelope_data: dict[str, OpEnvelopes] = {op_id: op_instance for op_instance, op_id in map(self._handle_op_env, self._redback_open_env_data)}
+        envelope_calendar_list = [self._handle_envelope_calendar(op_env) for op_env in self._redback_open_env_data]
+        entity_data: dict[str, RedbackEntitys] = {ent_id: ent_instance for ent_instance, ent_id in map(self._handle_entity, self._redback_entities)}
+        self._entity_instances = entity_data
+        device_info_data: dict[str, DeviceInfo] = {dev_id: device_instance for device_instance, dev_id in map(self._handle_device_info, self._redback_device_info)}
+        button_data: dict[str, Buttons] = {button_id: button_instance for button_instance, button_id in map(self._handle_button, self._redback_buttons)}
+        numbers_data: dict[str, Numbers] = {number_id: number_instance for number_instance, number_id in map(self._handle_number, self._redback_numbers)}
+        text_data: dict[str, Text] = {text_id: text_instance for text_instance, text_id in map(self._handle_text, self._redback_text)}
+        selects_data: dict[str, Selects] = {select_id: select_instance for select_instance, select_id in map(self._handle_select, self._redback_selects)}
+        schedules_data: dict[str, ScheduleInfo] = {schedule_id: schedule_instance for schedule_instance, schedule_id in map(self._handle_schedule, self._redback_schedules)}
+        inverter_calendar_list = [self._handle_inverter_calendar(schedule) for schedule in self._redback_schedules]
+        schedules_datetime_data: dict[str, ScheduleDateTime] = {schedule_id: schedule_instance for schedule_instance, schedule_id in map(self._handle_schedule_datetime, self._redback_schedule_datetime)}
 
         return RedbackTechData(
             user_id = self.client_id,
@@ -182,25 +336,60 @@ class RedbackTechClient:
             'Content-Type': Header.CONTENT_TYPE,
         }
 
-        #data = b'client_id=' + self.client_id.encode() + b'&client_secret=' + self.client_secret.encode() + '&grant_type=' + OAUTH_GRANT_TYPE + '&scope=' + OAUTH_SCOPE
-        data = 'client_id=' + self.client_id + '&client_secret=' + self.client_secret + '&grant_type=' + OAUTH_GRANT_TYPE + '&scope=' + OAUTH_SCOPE
+        #aiohttp form-encodes a dict, so credentials containing &, = or + survive intact
+        data = {
+            'client_id': self.client_id,
+            'client_secret': self.client_secret,
+            'grant_type': OAUTH_GRANT_TYPE,
+            'scope': OAUTH_SCOPE
+        }
 
         response = await self._api_post(login_url, headers, data)
         self.token = response['token_type'] + ' '+ response['access_token']
-        self.token_type = ['token_type']
+        self.token_type = response['token_type']
+        #Request headers only change when the token does, so build them once here
+        self._auth_headers = {'Authorization': self.token, 'Content-Type': 'text/json', 'accept': 'text/plain'}
+        self._auth_headers_json = {'Authorization': self.token, 'Content-Type': 'application/json', 'accept': 'text/plain'}
+        self._auth_headers_get = {'Authorization': self.token}
         self.token_expiration = datetime.now() + timedelta(seconds=response['expires_in'])
         return
 
-    async def _portal_login(self) -> None:
-        """Login to Redback Portal and obtain token."""
-        self._session2 = ClientSession() #.cookie_jar.clear()
+    def _device_id(self, serial_number: str, suffix: str) -> str:
+        """Return the entity device id for a serial number, e.g. the last four characters plus 'inv'."""
+        key = (serial_number, suffix)
+        device_id = self._id_cache.get(key)
+        if device_id is None:
+            device_id = self._id_cache[key] = (serial_number[-4:] + suffix).lower()
+        return device_id
+
+    def _create_connector(self) -> TCPConnector:
+        """Create the pooled connector shared by the API and Portal sessions.
+
+        Both sessions reuse one SSL context and DNS cache; the connector is
+        owned by the client and closed in close_sessions.
+        """
+        if self._connector is None or self._connector.closed:
+            self._connector = TCPConnector(limit=100, limit_per_host=10, ttl_dns_cache=300, ssl=_ssl_context())
+        return self._connector
+
+    async def _portal_login(self) -> str | None:
+        """Login to Redback Portal and obtain token.
+
+        The portal session and its cookies are shared, so callers must hold
+        _portal_lock for the whole login-then-request sequence.
+        """
+        #Reuse the portal session so its connection pool survives between logins, only the cookies are reset
+        if self._session2 is None or self._session2.closed:
+            self._session2 = ClientSession(connector=self._create_connector(), connector_owner=False, timeout=self._timeout)
+        else:
+            self._session2.cookie_jar.clear()
         login_url = f'{BaseUrl.PORTAL}{Endpoint.PORTAL_LOGIN}'
         response = await self._portal_get(login_url, {}, {})
-        await self._get_portal_token(response, 1)
+        token = await self._get_portal_token(response, 1)
         data={
             "Email": self.portal_email,
             "Password": self.portal_password,
-            "__RequestVerificationToken": self._GAFToken
+            "__RequestVerificationToken": token
         }
 
         headers = {
@@ -208,7 +397,7 @@ class RedbackTechClient:
         }
 
         response = await self._portal_post(login_url, headers, data)
-        return
+        return token
 
     async def test_api_connection(self) -> dict[str, Any]:
         """Test API connection."""
@@ -219,80 +408,65 @@ class RedbackTechClient:
 
     async def test_portal_connection(self) -> dict[str, Any]:
         """Test Portal connection."""
-        self._GAFToken = None
-        await self._portal_login()
-        if self._GAFToken is not None:
-            await self._session2.close()
-            return True
-        await self._session2.close()
-        return False
+        async with self._portal_lock:
+            token = await self._portal_login()
+            return token is not None
 
     async def delete_inverter_schedule(self, device_id: str, schedule_selector: str) -> dict[str, Any]:
         """Delete inverter schedule."""
         serial_number = None
         schedule_id = None
         if schedule_selector is not None:
-            self._redback_schedule_selected.update([(device_id,{'schedule_selector': None})])
-            for device in self._redback_device_info:
-                if device['identifiers'] == device_id:
-                    serial_number = device['serial_number']
-                    break
-            for schedules in self._redback_schedules:
-                if schedules['schedule_selector'] == schedule_selector:
-                    schedule_id = schedules['schedule_id']
-                    break
+            self._redback_schedule_selected[device_id] = {'schedule_selector': None}
+            device = self._redback_device_info_by_id.get(device_id)
+            if device is not None:
+                serial_number = device['serial_number']
+            schedule = self._schedules_by_selector.get(schedule_selector)
+            if schedule is not None:
+                schedule_id = schedule['schedule_id']
             if schedule_id is not None and serial_number is not None:
                 await self._check_token()
-                headers = {
-                    'Authorization': self.token,
-                    'Content_type': 'text/json',
-                    'accept': 'text/plain'
-                }
-                await self._api_delete(url=f'{BaseUrl.API}{Endpoint.API_SCHEDULE_DELETE_BY_SERIALNUMBER_SCHEDULEID}{serial_number}' + '/' + schedule_id, headers=headers, data='' )
+                headers = self._auth_headers
+                try:
+                    await self._api_delete(url=f'{BaseUrl.API}{Endpoint.API_SCHEDULE_DELETE_BY_SERIALNUMBER_SCHEDULEID}{serial_number}' + '/' + schedule_id, headers=headers, data='' )
+                finally:
+                    self._invalidate_static_cache(serial_number, Endpoint.API_SCHEDULE_BY_SERIALNUMBER)
         return
 
     async def delete_all_inverter_schedules(self, device_id: str):
         """Delete all inverter schedules."""
-        self._redback_schedule_selected.update([(device_id,{'schedule_selector': None})])
-        for device in self._redback_device_info:
-            if device['identifiers'] == device_id:
-                serial_number = device['serial_number']
-                break
-        headers = {
-            'Authorization': self.token,
-            'Content_type': 'text/json',
-            'accept': 'text/plain'
-        }
-        for schedule in self._redback_schedules:
-            if schedule['serial_number'] == serial_number:
-                await self._api_delete(url=f'{BaseUrl.API}{Endpoint.API_SCHEDULE_DELETE_BY_SERIALNUMBER_SCHEDULEID}{serial_number}' + '/' + schedule['schedule_id'], headers=headers, data='' )
+        self._redback_schedule_selected[device_id] = {'schedule_selector': None}
+        serial_number = self._redback_device_info_by_id[device_id]['serial_number']
+        await self._check_token()
+        headers = self._auth_headers
+        #Some deletes may have landed even if one fails, so always drop the cached schedules
+        try:
+            await asyncio.gather(*(
+                self._api_delete(url=f'{BaseUrl.API}{Endpoint.API_SCHEDULE_DELETE_BY_SERIALNUMBER_SCHEDULEID}{serial_number}' + '/' + schedule['schedule_id'], headers=headers, data='' )
+                for schedule in self._redback_schedules if schedule['serial_number'] == serial_number
+            ))
+        finally:
+            self._invalidate_static_cache(serial_number, Endpoint.API_SCHEDULE_BY_SERIALNUMBER)
         return
 
     async def create_schedule_service(self, device_id: str, mode: str, power: int, duration: int, start_time: datetime) -> dict[str, Any]:
         """Create schedule service."""
-        self._inverter_control_settings.update([(device_id,{'power_setting_mode': mode, 'power_setting_watts': power, 'power_setting_duration': duration, 'start_time': start_time})])
+        self._inverter_control_settings[device_id] = {'power_setting_mode': mode, 'power_setting_watts': power, 'power_setting_duration': duration, 'start_time': start_time}
         await self.set_inverter_schedule(device_id)
         return
 
     async def set_inverter_schedule(self, device_id):
         """Set inverter schedule."""
-        for device in self._redback_device_info:
-            if device['identifiers'] == device_id:
-                serial_number = device['serial_number']
-                break
+        serial_number = self._redback_device_info_by_id[device_id]['serial_number']
         mode = self._inverter_control_settings[device_id]['power_setting_mode']
         power = self._inverter_control_settings[device_id]['power_setting_watts']
         duration = self._inverter_control_settings[device_id]['power_setting_duration']
         start_time = self._inverter_control_settings[device_id]['start_time']
 
-        ### convert duration to format
-        days = int(duration/1440)
-        if days < 0:
-            days = 0
-        hours = int(duration/60)
-        minutes = ('00'+str(int(duration - (hours * 60))))[-2:]
-        hours = ('00'+str(hours))[-2:]
-        duration_str = f'{days}.{hours}:{minutes}:00'
+        ### convert duration in minutes to the API's D.HH:MM:SS format
+        days, minutes = divmod(max(int(duration), 0), 1440)
+        hours, minutes = divmod(minutes, 60)
+        duration_str = f'{days}.{hours:02d}:{minutes:02d}:00'
 
         post_data = {
             'SerialNumber': serial_number,
@@ -304,13 +478,10 @@ class RedbackTechClient:
                 'ArgumentInWatts': int(power)
             }
         }
-        headers = {
-            'Authorization': self.token,
-            'Content_type': 'application/json',
-            'accept': 'text/plain'
-        }
         await self._check_token()
+        headers = self._auth_headers_json
         await self._api_post_json(f'{BaseUrl.API}{Endpoint.API_SCHEDULE_CREATE_BY_SERIALNUMBER}', headers, post_data)
+        self._invalidate_static_cache(serial_number)
         return
 
     async def _get_inverter_mppt_data(self, serial_numbers: str) -> dict[str, Any]:
@@ -356,11 +527,9 @@ class RedbackTechClient:
     async def set_inverter_mode_portal(self, device_id: str, mode='Auto', power = 0, mode_override=False):
         """Set inverter mode."""
         LOGGER.debug('Setting inverter mode for %s to %s with power %s', device_id, mode, power)
-        for device in self._redback_device_info:
-            if device['identifiers'] == device_id+'inv':
-                serial_number = device['serial_number']
-                ross_version = device['sw_version']
-                break
+        device = self._redback_device_info_by_id[device_id+'inv']
+        serial_number = device['serial_number']
+        ross_version = device['sw_version']
         if mode_override:
             mode = 'Auto'
             power = 0
@@ -371,89 +540,72 @@ class RedbackTechClient:
             if power < 0 or power > 10000:
                 mode = 'Auto'
                 power = 0
-        await self._portal_login()
-        full_url = f'{BaseUrl.PORTAL}{Endpoint.PORTAL_CONFIGURE}{serial_number}'
-        response = await self._portal_get(full_url, {}, {})
-        await self._get_portal_token(response, 2)
-        headers = {
-            'X-Requested-With': Header.X_REQUESTED_WITH,
-            'Content-Type': Header.CONTENT_TYPE,
-            'Referer': full_url
-        }
-        data = {
-            'SerialNumber':serial_number,
-            'AppliedTariffId':'',
-            'InverterOperation[Type]':InverterOperationType.SET,
-            'InverterOperation[Mode]':mode,
-            'InverterOperation[PowerInWatts]':power,
-            'InverterOperation[AppliedTarrifId]':'',
-            'ProductModelName': '',
-            'RossVersion':ross_version,
-            '__RequestVerificationToken':self._GAFToken     
-        }
-        LOGGER.debug('Setting inverter mode data: %s ', data)
-        full_url = f'{BaseUrl.PORTAL}{Endpoint.PORTAL_INVERTER_SET}'
-        await self._portal_post(full_url, headers, data)
-        await self._session2.close()
+        async with self._portal_lock:
+            await self._portal_login()
+            full_url = f'{BaseUrl.PORTAL}{Endpoint.PORTAL_CONFIGURE}{serial_number}'
+            response = await self._portal_get(full_url, {}, {})
+            token = await self._get_portal_token(response, 2)
+            headers = {
+                'X-Requested-With': Header.X_REQUESTED_WITH,
+                'Content-Type': Header.CONTENT_TYPE,
+                'Referer': full_url
+            }
+            data = {
+                'SerialNumber':serial_number,
+                'AppliedTariffId':'',
+                'InverterOperation[Type]':InverterOperationType.SET,
+                'InverterOperation[Mode]':mode,
+                'InverterOperation[PowerInWatts]':power,
+                'InverterOperation[AppliedTarrifId]':'',
+                'ProductModelName': '',
+                'RossVersion':ross_version,
+                '__RequestVerificationToken':token
+            }
+            LOGGER.debug('Setting inverter mode data: %s ', data)
+            full_url = f'{BaseUrl.PORTAL}{Endpoint.PORTAL_INVERTER_SET}'
+            await self._portal_post(full_url, headers, data)
+        self._invalidate_static_cache(serial_number)
         return
 
     async def update_inverter_control_values(self, device_id, data_key, data_value):
         """Update inverter control values."""
-        temp = self._inverter_control_settings.get(device_id)
-        temp.update([(data_key, data_value)])
-        self._inverter_control_settings.update([(device_id, temp)])
+        self._inverter_control_settings[device_id][data_key] = data_value
         return
 
     async def reset_inverter_start_time_to_now(self, device_id):
         """Update inverter control values."""
-        temp = self._inverter_control_settings.get(device_id)
-        temp.update([('start_time', datetime.now(timezone.utc))])
-        self._inverter_control_settings.update([(device_id, temp)])
+        self._inverter_control_settings[device_id]['start_time'] = _UTCNOW(_UTC)
         return    
 
     async def update_selected_schedule_id(self, device_id, schedule_id: str) -> None:
         """Update selected schedule id."""
-        temp = self._redback_schedule_selected.get(device_id)
-        temp.update([('schedule_selector', schedule_id)])
-        self._redback_schedule_selected.update([(device_id, temp)])
+        self._redback_schedule_selected[device_id]['schedule_selector'] = schedule_id
         return
 
     async def update_selected_op_env_id(self, device_id, op_env_id: str) -> None:
         """Update selected schedule id."""
-        temp = self._redback_op_env_selected.get(device_id)
-        temp.update([('schedule_selector', op_env_id)])
-        self._redback_op_env_selected.update([(device_id, temp)])
+        self._redback_op_env_selected[device_id]['schedule_selector'] = op_env_id
         return
 
     async def update_op_envelope_values(self, device_id, data_key, data_value):
         """Update inverter control values."""
-        temp = self._redback_op_env_create_settings.get(device_id)
-        temp.update([(data_key, data_value)])
-        self._redback_op_env_create_settings.update([(device_id, temp)])
+        self._redback_op_env_create_settings[device_id][data_key] = data_value
         return
 
     async def delete_all_envelopes(self, device_id,) -> dict[str, Any]:
         """Delete all envelopes."""
-        self._redback_op_env_selected.update([(device_id,{'schedule_selector': None})])
+        self._redback_op_env_selected[device_id] = {'schedule_selector': None}
         await self._check_token()
-        headers = {
-            'Authorization': self.token,
-            'Content_type': 'text/json',
-            'accept': 'text/plain'
-        }
+        headers = self._auth_headers
         full_url = f'{BaseUrl.API}{Endpoint.API_OPENVELOPE_DELETE_ALL}'
         await self._api_delete(full_url, headers, '')
         return
 
     async def delete_op_env_by_id(self, device_id, op_env_id: str) -> dict[str, Any]:
         """Delete op env by id."""
-        self._redback_op_env_selected.update([(device_id,{'schedule_selector': None})])
+        self._redback_op_env_selected[device_id] = {'schedule_selector': None}
         await self._check_token()
-        headers = {
-            'Authorization': self.token,
-            'Content_type': 'text/json',
-            'accept': 'text/plain'
-        }
+        headers = self._auth_headers
         full_url = f'{BaseUrl.API}{Endpoint.API_OPENVELOPE_BY_EVENTID}{op_env_id}'
         await self._api_delete(full_url, headers, '')
         return
@@ -461,11 +613,7 @@ class RedbackTechClient:
     async def create_op_envelope(self, device_id: str) -> dict[str, Any]:
         """Create op envelope."""
         await self._check_token()
-        headers = {
-            'Authorization': self.token,
-            'Content_type': 'application/json',
-            'accept': 'text/plain'
-        }
+        headers = self._auth_headers_json
         post_data = self._redback_op_env_create_settings[device_id]
         post_data['EventId'] = post_data['EventId'] + '-' + str(uuid.uuid4())[0:6]
         full_url = f'{BaseUrl.API}{Endpoint.API_OPENVELOPE_CREATE}'
@@ -485,11 +633,7 @@ class RedbackTechClient:
             'StartAtUtc': start_at_utc,
             'EndAtUtc': end_at_utc,
             'SiteId': site_id}
-        headers = {
-            'Authorization': self.token,
-            'Content_type': 'application/json',
-            'accept': 'text/plain'
-        }
+        headers = self._auth_headers_json
         full_url = f'{BaseUrl.API}{Endpoint.API_OPENVELOPE_CREATE}'
         response = await self._api_post_json(full_url, headers, post_data)
         return response
@@ -497,20 +641,22 @@ class RedbackTechClient:
     async def _create_op_env_data(self):
         """Create Operating Envelope Data."""
         #Create the Device info for Operating Envelopes
-        await self._create_device_info_op_env()
+        self._create_device_info_op_env()
         #Create the data set
         self._redback_open_env_data = []
-        temp_timenow = datetime.now(timezone.utc)
-        for site in self._redback_site_ids:
+        temp_timenow = _UTCNOW(_UTC)
+        #Fetch the envelopes for all sites concurrently
+        await self._check_token()
+        site_responses = await asyncio.gather(*(self._get_op_env_by_site(site) for site in self._redback_site_ids))
+        for site, response in zip(self._redback_site_ids, site_responses):
             device_id = site[-4:] + 'env'
             self._redback_op_env_data.setdefault(site, None)
             self._redback_op_env_active.setdefault(site, None)
-            await self._create_op_env_active_entities(data=None, device_id=device_id, site=site)
-            await self._create_op_env_number_entities(device_id, site)
-            await self._create_op_env_text_entities(device_id, site)
-            await self._create_op_env_datetime_entities(device_id, site)
-            
-            response = await self._get_op_env_by_site(site)
+            self._create_op_env_active_entities(data=None, device_id=device_id, site=site)
+            self._create_op_env_number_entities(device_id, site)
+            self._create_op_env_text_entities(device_id, site)
+            self._create_op_env_datetime_entities(device_id, site)
+
             if response['TotalCount'] > 0:
                 self._redback_op_env_data[site] = True
             else:
@@ -528,11 +674,11 @@ class RedbackTechClient:
                     data['ReportedFinishUtc'] = datetime.fromisoformat((data['ReportedFinishUtc']).replace('Z','+00:00'))
                 if start_at_time < temp_timenow  < end_at_time:
                     self._redback_op_env_active[site] = True
-                    await self._create_op_env_active_entities(data=data, device_id=device_id, site=site)
+                    self._create_op_env_active_entities(data=data, device_id=device_id, site=site)
                 self._redback_open_env_data.append({'openv_id': openv_id, 'data': data})
-            await self._create_op_env_select_entities(site, device_id)
-            await self._add_selected_op_env_entities(site, device_id)
-            await self._create_op_env_status_entities(site, device_id,response['TotalCount'] )
+            self._create_op_env_select_entities(site, device_id)
+            self._add_selected_op_env_entities(site, device_id)
+            self._create_op_env_status_entities(site, device_id,response['TotalCount'] )
         return
 
     async def _get_inverter_list(self) -> dict[str, Any]:
@@ -541,9 +687,7 @@ class RedbackTechClient:
         self._redback_site_ids = []
         
         await self._check_token()
-        headers = {
-            'Authorization': self.token
-        }
+        headers = self._auth_headers_get
         full_url = f'{BaseUrl.API}{Endpoint.API_NODES}'
         response = await self._api_get(full_url, headers, {})
 
@@ -557,84 +701,117 @@ class RedbackTechClient:
     async def _get_dynamic_by_serial(self, serial_number: str) -> dict[str, Any]:
         """/Api/v2.21/EnergyData/Dynamic/BySerialNumber/{serialNumber}"""
         await self._check_token()
-        headers = {
-            'Authorization': self.token,
-            'Content_type': 'text/json',
-            'accept': 'text/plain'
-        }
+        headers = self._auth_headers
         full_url = f'{BaseUrl.API}{Endpoint.API_ENERGY_DYNAMIC_BY_SERIAL}{serial_number}'
-        response = await self._api_get(full_url, headers, {})
+        response = await self._api_get(full_url, headers, {}, use_cache=False)
         return response
 
     async def _get_config_by_serial(self, serial_number: str) -> dict[str, Any]:
         """/Api/v2/Configuration/Configuration/BySerialNumber/{serialNumber}"""
-        headers = {
-            'Authorization': self.token,
-            'Content_type': 'text/json',
-            'accept': 'text/plain'
-        }
+        response = self._get_static_cache(Endpoint.API_CONFIG_BY_SERIAL, serial_number)
+        if response is not None:
+            return response
+        headers = self._auth_headers
         full_url = f'{BaseUrl.API}{Endpoint.API_CONFIG_BY_SERIAL}{serial_number}'
         response = await self._api_get(full_url, headers, {})
+        self._set_static_cache(Endpoint.API_CONFIG_BY_SERIAL, serial_number, response, self._static_refresh)
         return response
 
     async def _get_static_by_serial(self, serial_number: str) -> dict[str, Any]:
         """/Api/v2/EnergyData/Static/BySerialNumber/{serialNumber}"""
+        response = self._get_static_cache(Endpoint.API_STATIC_BY_SERIAL, serial_number)
+        if response is not None:
+            return response
         await self._check_token()
-        headers = {
-            'Authorization': self.token,
-            'Content_type': 'text/json',
-            'accept': 'text/plain'
-        }
+        headers = self._auth_headers
         full_url = f'{BaseUrl.API}{Endpoint.API_STATIC_BY_SERIAL}{serial_number}'
         response = await self._api_get(full_url, headers, {})
+        self._set_static_cache(Endpoint.API_STATIC_BY_SERIAL, serial_number, response, self._static_refresh)
         return response
 
+    def _get_static_cache(self, endpoint: Endpoint, serial_number: str) -> dict[str, Any] | None:
+        """Return a cached static response if it has not expired."""
+        cached = self._static_cache.get((endpoint, serial_number))
+        if cached is None or cached[0] < datetime.now():
+            return None
+        return cached[1]
+
+    def _set_static_cache(self, endpoint: Endpoint, serial_number: str, response: dict[str, Any], refresh: int) -> None:
+        """Cache a slow changing response for refresh seconds."""
+        self._static_cache[(endpoint, serial_number)] = (datetime.now() + timedelta(seconds=refresh), response)
+
+    def _invalidate_static_cache(self, serial_number: str, endpoint: Endpoint | None = None) -> None:
+        """Drop cached responses for a serial number after it is reconfigured."""
+        for key in [key for key in self._static_cache if key[1] == serial_number and endpoint in (None, key[0])]:
+            del self._static_cache[key]
+
+    def set_refresh_interval(self, static: int | None = None, schedules: int | None = None, poll: int | None = None, poll_max: int | None = None) -> None:
+        """Tune how long slow changing data is reused and the suggested poll interval range, all in seconds."""
+        if static is not None:
+            self._static_refresh = static
+        if schedules is not None:
+            self._schedule_refresh = schedules
+        if poll is not None:
+            self._poll_interval_min = poll
+            self._poll_interval = max(self._poll_interval, poll)
+        if poll_max is not None:
+            self._poll_interval_max = poll_max
+            self._poll_interval = min(self._poll_interval, poll_max)
+
+    @property
+    def poll_interval(self) -> float:
+        """Suggested seconds until the next get_redback_data call.
+
+        Starts at POLLINTERVAL and grows by POLLBACKOFF, up to POLLINTERVALMAX,
+        each time the inverters report no new dynamic data.
+        """
+        return self._poll_interval
+
+    def _update_poll_interval(self, dynamic_data: dict[str, Any]) -> None:
+        """Back the suggested poll interval off while the dynamic data is unchanged."""
+        timestamps = {serial_number: response['Data']['TimestampUtc'] for serial_number, response in dynamic_data.items()}
+        if timestamps and timestamps == self._dynamic_timestamps:
+            self._poll_interval = min(self._poll_interval * POLLBACKOFF, self._poll_interval_max)
+        else:
+            self._poll_interval = self._poll_interval_min
+        self._dynamic_timestamps = timestamps
+
     async def _get_op_env_by_site(self, site_id: str) -> dict[str, Any]:
         """/Api/v2/OperatingEnvelope/By/Site/{siteId}"""
         await self._check_token()
-        headers = {
-            'Authorization': self.token,
-            'Content_type': 'text/json',
-            'accept': 'text/plain'
-        }
+        headers = self._auth_headers
         full_url = f'{BaseUrl.API}{Endpoint.API_OPENVELOPE_BY_SITE_ALL}{site_id}'
         response = await self._api_get(full_url, headers, {})
         return response
 
     async def _get_schedules_by_serial(self, serial_number: str) -> dict[str, Any]:
-        """/Api/v2/EnergyData/Static/BySerialNumber/{serialNumber}"""
+        """/Api/v2/Schedule/By/SerialNumber/{serialNumber}"""
+        response = self._get_static_cache(Endpoint.API_SCHEDULE_BY_SERIALNUMBER, serial_number)
+        if response is not None:
+            return response
         await self._check_token()
-        headers = {
-            'Authorization': self.token,
-            'Content_type': 'text/json',
-            'accept': 'text/plain'
-        }
+        headers = self._auth_headers
         full_url = f'{BaseUrl.API}{Endpoint.API_SCHEDULE_BY_SERIALNUMBER}{serial_number}'
         response = await self._api_get(full_url, headers, {})
+        self._set_static_cache(Endpoint.API_SCHEDULE_BY_SERIALNUMBER, serial_number, response, self._schedule_refresh)
         return response
 
-    async def _get_config_by_multiple_serial(self, serial_numbers: str | None=None) -> dict[str, Any]:
+    async def _get_config_by_multiple_serial(self, serial_numbers: list[str] | None=None) -> dict[str, Any]:
         """Get config by multiple serial numbers."""
-        self._serial_numbers: str = serial_numbers if serial_numbers else self._serial_numbers
-        if self._serial_numbers is None:
-            self._serial_numbers = await self._get_inverter_list()
+        serial_numbers = serial_numbers if serial_numbers else self._serial_numbers
+        if not serial_numbers:
+            serial_numbers = await self._get_inverter_list()
         await self._check_token()
-        headers = {
-            'Authorization': self.token,
-            'Content_type': 'text/json',
-            'accept': 'text/plain'
-        }
+        headers = self._auth_headers
         full_url = f'{BaseUrl.API}{Endpoint.API_STATIC_MULTIPLE_BY_SERIAL}'
-        response = await self._api_post_json(full_url, headers, self._serial_numbers)
+        response = await self._api_post_json(full_url, headers, serial_numbers)
         return response
 
     async def _get_site_list(self) -> dict[str, Any]:
         """Get site list."""
         site_ids = []
         await self._check_token()
-        headers = {
-            'Authorization': self.token
-        }
+        headers = self._auth_headers_get
         full_url = f'{BaseUrl.API}{Endpoint.API_SITES}'
         response = await self._api_get(full_url, headers, {})
         for site in response['Data']:
@@ -644,52 +821,67 @@ class RedbackTechClient:
     async def close_sessions(self) -> None:
         """Close sessions."""
         await self._session1.close()
-        await self._session2.close()
+        if self._session2 is not None:
+            await self._session2.close()
+        if self._connector is not None:
+            await self._connector.close()
         return True
 
     async def _create_device_info(self) -> None:
         """Create device info."""
         if await self._check_device_info_refresh():
             self._serial_numbers = await self._get_inverter_list()
-            await self._get_inverter_mppt_data(self._serial_numbers)
-            self._device_info_refresh_time = datetime.now() + timedelta(seconds=DEVICEINFOREFRESH)
+            async with self._portal_lock:
+                await self._get_inverter_mppt_data(self._serial_numbers)
+            self._device_info_refresh_time = datetime.now() + timedelta(seconds=self._static_refresh)
         self._redback_device_info = []
+        self._redback_device_info_by_id = {}
         self._redback_entities = []
         self._redback_schedules = []
+        self._schedules_by_device = {}
+        self._schedules_by_selector = {}
         self._redback_numbers = []
         self._redback_selects = []
         self._redback_schedule_datetime = []
+        #Refresh the token once so the concurrent requests below don't all race to login
+        await self._check_token()
+        #Fetch static data for all inverters concurrently, only missing or expired entries hit the API
+        static_responses = await asyncio.gather(*(self._get_static_by_serial(serial_number) for serial_number in self._serial_numbers))
+        static_data = dict(zip(self._serial_numbers, static_responses))
+        #Fetch dynamic data for all inverters, plus config and schedules for those with a battery, concurrently
+        battery_serials = [serial_number for serial_number in self._serial_numbers if static_data[serial_number]['Data']['Nodes'][0]['StaticData']['BatteryCount'] > 0]
+        dynamic_responses, soc_responses, schedule_responses = await asyncio.gather(
+            asyncio.gather(*(self._get_dynamic_by_serial(serial_number) for serial_number in self._serial_numbers)),
+            asyncio.gather(*(self._get_config_by_serial(serial_number) for serial_number in battery_serials)),
+            asyncio.gather(*(self._get_schedules_by_serial(serial_number) for serial_number in battery_serials)),
+        )
+        dynamic_data = dict(zip(self._serial_numbers, dynamic_responses))
+        self._update_poll_interval(dynamic_data)
+        soc_data_by_serial = dict(zip(battery_serials, soc_responses))
+        schedule_data = dict(zip(battery_serials, schedule_responses))
         #For each Inverter found prepare the data wanted
         for serial_number in self._serial_numbers:
-            self._response1_data.setdefault(serial_number, None)
-            self._response1_data_timer.setdefault(serial_number, None)
-            if self._response1_data[serial_number] is None:
-                self._response1_data[serial_number] = await self._get_static_by_serial(serial_number)
-                self._response1_data_timer[serial_number]= datetime.now() + timedelta(seconds=DEVICEINFOREFRESH)
-            elif self._response1_data_timer[serial_number] < datetime.now():
-                self._response1_data[serial_number] = await self._get_static_by_serial(serial_number)
-                self._response1_data_timer[serial_number]= datetime.now() + timedelta(seconds=DEVICEINFOREFRESH)
-            response1 = self._response1_data[serial_number]
-            response2 = await self._get_dynamic_by_serial(serial_number)
+            response1 = static_data[serial_number]
+            response2 = dynamic_data[serial_number]
             self._redback_site_load[serial_number]=0
             #process and prepare base data wanted
-            await self._convert_responses_to_inverter_entities(response1, response2)
+            self._convert_responses_to_inverter_entities(response1, response2)
             #If we find a battery attached to the inverter process and prepare additional data wanted
-            if response1['Data']['Nodes'][0]['StaticData']['BatteryCount'] > 0:
-                soc_data = await self._get_config_by_serial(response1['Data']['Nodes'][0]['StaticData']['Id'])
-                await self._convert_responses_to_battery_entities(response1, response2, soc_data)
-                await self._create_device_info_battery(response1)
-                response3 = await self._get_schedules_by_serial(serial_number)
-                await self._convert_responses_to_schedule_entities(response3, response1)
-                await self._create_number_entities(response1)
-                await self._create_select_entities(response1, response3)
-                await self._create_datetime_entities(response1)
-                await self._add_selected_schedule(response1)
-            await self._add_additional_entities(self._redback_site_load[serial_number], response1)
-            await self._create_device_info_inverter(response1)
+            if serial_number in soc_data_by_serial:
+                soc_data = soc_data_by_serial[serial_number]
+                self._convert_responses_to_battery_entities(response1, response2, soc_data)
+                self._create_device_info_battery(response1)
+                response3 = schedule_data[serial_number]
+                self._convert_responses_to_schedule_entities(response3, response1)
+                self._create_number_entities(response1)
+                self._create_select_entities(response1, response3)
+                self._create_datetime_entities(response1)
+                self._add_selected_schedule(response1)
+            self._add_additional_entities(self._redback_site_load[serial_number], response1)
+            self._create_device_info_inverter(response1)
         return
 
-    async def _handle_device_info(self, device: dict[str, Any]) -> (DeviceInfo, str):
+    def _handle_device_info(self, device: dict[str, Any]) -> (DeviceInfo, str):
         """Handle device info data."""
         device_instance = DeviceInfo(
             identifiers=device['identifiers'],
@@ -701,109 +893,96 @@ class RedbackTechClient:
         )
         return device_instance, device['identifiers']
 
-    async def _handle_op_env(self, op_env: dict[str, Any]) -> (OpEnvelopes, str):
+    def _handle_op_env(self, op_env: dict[str, Any]) -> (OpEnvelopes, str):
         """Handle op_env data."""
-        data = {
-            'id': op_env['openv_id']
-        }
+        item_id = op_env['openv_id']
         op_env_instance = OpEnvelopes(
-            id=data['id'],
+            id=item_id,
             site_id=op_env['data']['SiteId'],
             data=op_env['data']
         )
-        return op_env_instance, data['id']
+        return op_env_instance, item_id
 
-    async def _handle_button(self, device: dict[str, Any]) -> (Buttons, str):
+    def _handle_button(self, device: dict[str, Any]) -> (Buttons, str):
         """Handle button data."""
-        data = {
-            'id': device['device_id'] + device['entity_name']
-        }
+        item_id = intern(device['device_id'] + device['entity_name'])
         button_instance = Buttons(
-            id=data['id'],
+            id=item_id,
             device_serial_number=device['device_id'],
             data=device,
             type=device['device_type']
         )
-        return button_instance, data['id']
+        return button_instance, item_id
 
-    async def _handle_number(self, device: dict[str, Any]) -> (Numbers, str):
+    def _handle_number(self, device: dict[str, Any]) -> (Numbers, str):
         """Handle number data."""
-        data = {
-            'id': device['device_id'] + device['entity_name']
-        }
+        item_id = intern(device['device_id'] + device['entity_name'])
         number_instance = Numbers(
-            id=data['id'],
+            id=item_id,
             device_serial_number=device['device_id'],
             data=device,
             type=device['device_type']
         )
-        return number_instance, data['id']
+        return number_instance, item_id
     
-    async def _handle_text(self, device: dict[str, Any]) -> (Text, str):
+    def _handle_text(self, device: dict[str, Any]) -> (Text, str):
         """Handle text data."""
-        data = {
-            'id': device['device_id'] + device['entity_name']
-        }
+        item_id = intern(device['device_id'] + device['entity_name'])
         text_instance = Text(
-            id=data['id'],
+            id=item_id,
             site_id=device['device_id'],
             data=device
         )
-        return text_instance, data['id']
+        return text_instance, item_id
 
-    async def _handle_select(self, device: dict[str, Any]) -> (Selects, str):
+    def _handle_select(self, device: dict[str, Any]) -> (Selects, str):
         """Handle select data."""
-        data = {
-            'id': device['device_id'] + device['entity_name']
-        }
+        item_id = intern(device['device_id'] + device['entity_name'])
         select_instance = Selects(
-            id=data['id'],
+            id=item_id,
             device_serial_number=device['device_id'],
             data=device,
             type=device['device_type']
         )
-        return select_instance, data['id']
+        return select_instance, item_id
 
-    async def _handle_entity(self, entity: dict[str, Any]) -> (RedbackEntitys, str):
+    def _handle_entity(self, entity: dict[str, Any]) -> (RedbackEntitys, str):
         """Handle entity data."""
-        data = {
-            'id': entity['device_id'] + entity['entity_name']
-        }
-        entity_instance = RedbackEntitys(
-            entity_id=data['id'],
-            device_id=entity['device_id'],
-            type=entity['device_type'],
-            data=entity,
-        )
-        return entity_instance, data['id']
+        item_id = intern(entity['device_id'] + entity['entity_name'])
+        #Most entities are unchanged between polls, so hand back last poll's instance when its data still matches
+        entity_instance = self._entity_instances.get(item_id)
+        if entity_instance is None or entity_instance.data != entity:
+            entity_instance = RedbackEntitys(
+                entity_id=item_id,
+                device_id=entity['device_id'],
+                type=entity['device_type'],
+                data=entity,
+            )
+        return entity_instance, item_id
 
-    async def _handle_schedule(self, schedule: dict[str, Any]) -> (ScheduleInfo, str):
+    def _handle_schedule(self, schedule: dict[str, Any]) -> (ScheduleInfo, str):
         """Handle schedule data."""
-        data = {
-            'id': schedule['schedule_id']
-        }
+        item_id = schedule['schedule_id']
         schedule_instance = ScheduleInfo(
-            schedule_id=data['id'],
+            schedule_id=item_id,
             data=schedule,
             device_serial_number = schedule['device_id'],
             start_time =  schedule['start_time_utc']
         )
-        return schedule_instance, data['id']
+        return schedule_instance, item_id
 
-    async def _handle_schedule_datetime(self, entity: dict[str, Any]) -> (ScheduleDateTime, str):
+    def _handle_schedule_datetime(self, entity: dict[str, Any]) -> (ScheduleDateTime, str):
         """Handle schedule data."""
-        data = {
-            'id': entity['device_id'] + entity['entity_name']
-        }
+        item_id = intern(entity['device_id'] + entity['entity_name'])
         schedule_instance = ScheduleDateTime(
-            id=data['id'],
+            id=item_id,
             device_serial_number = entity['device_id'],
             data=entity,
             type=entity['device_type']
         )
-        return schedule_instance, data['id']
+        return schedule_instance, item_id
     
-    async def _handle_inverter_calendar(self, entity: dict[str, Any]) -> dict[str, Any]:
+    def _handle_inverter_calendar(self, entity: dict[str, Any]) -> dict[str, Any]:
         """Handle schedule data."""
         if entity["inverter_mode"] == "Auto":
             mode = 'Auto'
@@ -847,7 +1026,7 @@ class RedbackTechClient:
         }
         return data
 
-    async def _handle_envelope_calendar(self, entity: dict[str, Any]) -> dict[str, Any]:
+    def _handle_envelope_calendar(self, entity: dict[str, Any]) -> dict[str, Any]:
         """Handle schedule data."""
 
         description_text = (
@@ -860,7 +1039,7 @@ class RedbackTechClient:
             + "Watts, Max Charge Power: " + str(entity['data']["MaxChargePowerW"])
             + ", Max Generation Power: " + str(entity['data']["MaxGenerationPowerVA"]) + "VA"
             )
-        device_id = (entity['data']['SiteId'][-4:] + 'env').lower()
+        device_id = self._device_id(entity['data']['SiteId'], 'env')
         data = {
             'schedule_selector' : entity['data']['schedule_selector'],
             'uuid' : entity['openv_id'],
@@ -878,34 +1057,72 @@ class RedbackTechClient:
         }
         return data
 
+    async def _api_request(self, method: str, url: str, use_cache: bool = False, **kwargs: Any) -> dict[str, Any]:
+        """Make an API call, raising RedbackTechClientError on an error status without reading the body.
+
+        At most max_concurrent_requests calls are in flight at once so the
+        gathered refreshes don't trip the API's rate limiter. GETs and DELETEs
+        are retried with exponential backoff on gateway errors and dropped
+        connections; POSTs are not, as they may already have been applied.
+        """
+        attempts = RETRYATTEMPTS if method in _RETRY_METHODS else 1
+        for attempt in range(1, attempts + 1):
+            try:
+                async with self._api_sem, self._session1.request(method, url, timeout=self._timeout, raise_for_status=True, **kwargs) as resp:
+                    body = await resp.read()
+                    response = self._api_response(body)
+                    if use_cache:
+                        expires = self._response_expiry(resp)
+                        if expires is not None:
+                            #Keep the raw body, callers convert the parsed response in place
+                            self._http_cache[url] = (expires, body)
+                        else:
+                            self._http_cache.pop(url, None)
+                    return response
+            except ClientResponseError as error:
+                if attempt == attempts or error.status not in RETRY_STATUSES:
+                    raise RedbackTechClientError(f'RedbackTech API Error Encountered. Status: {error.status}; Error: {error.message}') from error
+                LOGGER.debug('Retrying %s %s after status %s', method, url, error.status)
+            except ClientConnectionError as error:
+                if attempt == attempts:
+                    raise
+                LOGGER.debug('Retrying %s %s after %s', method, url, error)
+            await asyncio.sleep(RETRYBACKOFF * 2 ** (attempt - 1))
+
     async def _api_post(self, url: str, headers: dict[str, Any], data ) -> dict[str, Any]:
         """Make POST API call."""
-        async with self._session1.post(url, headers=headers, data=data, timeout=self.timeout) as resp:
-            return await self._api_response(resp)
+        return await self._api_request('POST', url, headers=headers, data=data)
 
     async def _api_post_json(self, url: str, headers: dict[str, Any], data ) -> dict[str, Any]:
         """Make POST API call."""
-        async with self._session1.post(url, headers=headers, json=data, timeout=self.timeout) as resp:
-            return await self._api_response(resp)
+        #Anything posted may change what the cached GETs would return
+        self._http_cache.clear()
+        #Serialize here rather than via the session's json_serialize, so a caller supplied session1 still uses orjson
+        return await self._api_request('POST', url, headers={**headers, 'Content-Type': 'application/json'}, data=orjson.dumps(data))
+
+    async def _api_get(self, url: str, headers: dict[str, Any], data: dict[str, Any], use_cache: bool = True) -> dict[str, Any]:
+        """Make GET API call.
 
-    async def _api_get(self, url: str, headers: dict[str, Any], data: dict[str, Any]) -> dict[str, Any]:
-        """Make GET API call."""
-        async with self._session1.get(url, headers=headers, data=data, timeout=self.timeout) as resp:
-            return await self._api_response(resp)
+        Responses the server marks as fresh via Cache-Control or Expires
+        are reused until they go stale, unless use_cache is False.
+        """
+        if use_cache:
+            cached = self._http_cache.get(url)
+            if cached is not None and cached[0] > _UTCNOW(_UTC):
+                return self._api_response(cached[1])
+        return await self._api_request('GET', url, use_cache=use_cache, headers=headers, data=data)
 
     async def _api_delete(self, url: str, headers: dict[str, Any], data: dict[str, Any]) -> dict[str, Any]:
-        """Make GET API call."""
-        async with self._session1.delete(url, headers=headers, data=data, timeout=self.timeout) as resp:
-            return await self._api_response(resp)
+        """Make DELETE API call."""
+        self._http_cache.clear()
+        return await self._api_request('DELETE', url, headers=headers, data=data)
 
     @staticmethod
-    async def _api_response(resp: ClientResponse):
+    def _api_response(body: bytes):
         """Return response from API call."""
-        if resp.status != 200:
-            error = await resp.text()
-            raise RedbackTechClientError(f'RedbackTech API Error Encountered. Status: {resp.status}; Error: {error}')
         try:
-            response: dict[str, Any] = await resp.json()
+            #orjson parses the raw bytes, skipping the charset decode to str that resp.json() does first
+            response: dict[str, Any] = orjson.loads(body)
         except Exception as error:
             raise RedbackTechClientError(f'Could not return json {error}') from error
         if 'error' in response:
@@ -916,35 +1133,63 @@ class RedbackTechClient:
                 raise RedbackTechClientError(f'RedbackTech API Error: {code}')
         return response
 
-    async def _check_device_info_refresh(self) -> None:
+    @staticmethod
+    def _response_expiry(resp: ClientResponse) -> datetime | None:
+        """Return when a response stops being fresh, or None if it can't be cached."""
+        now = _UTCNOW(_UTC)
+        directives = [directive.strip().lower() for directive in resp.headers.get('Cache-Control', '').split(',')]
+        if 'no-store' in directives or 'no-cache' in directives:
+            return None
+        for directive in directives:
+            if directive.startswith('max-age='):
+                try:
+                    max_age = int(directive[8:])
+                except ValueError:
+                    return None
+                return now + timedelta(seconds=max_age) if max_age > 0 else None
+        if 'Expires' in resp.headers:
+            try:
+                expires = parsedate_to_datetime(resp.headers['Expires'])
+            except (TypeError, ValueError):
+                return None
+            if expires.tzinfo is None:
+                expires = expires.replace(tzinfo=_UTC)
+            return expires if expires > now else None
+        return None
+
+    async def _check_device_info_refresh(self) -> bool:
         """Check to see if device info is about to expire.
-        If there is no device info, a new device info is obtained. In addition,
-        if the current device info is about to expire within 30 minutes
-        or has already expired, a new device info is obtained.
+        Returns True if there is no device info yet, or if the current
+        device info expires within 10 seconds or has already expired.
         """
-        current_dt = datetime.now()
         if self._device_info_refresh_time is None:
             return True
-        elif (self._device_info_refresh_time-current_dt).total_seconds() < 10:
-            return True
-        else:
-            return False
+        return (self._device_info_refresh_time - datetime.now()).total_seconds() < 10
 
     async def _check_token(self) -> None:
         """Check to see if there is a valid token or if token is about to expire.
         If there is no token, a new token is obtained. In addition,
-        if the current token is about to expire within 60 minutes
+        if the current token is about to expire within 5 minutes
         or has already expired, a new token is obtained.
         """
-        current_dt = datetime.now()
-        if (self.token or self.token_expiration) is None:
-            await self._api_login()
-        elif (self.token_expiration-current_dt).total_seconds() < 300:
-            await self._api_login()
-        else:
-            return None
-
-    async def _get_portal_token(self, response, type):
+        #Serialise refreshes so concurrent callers share a single login
+        async with self._token_lock:
+            if self.token is None or self.token_expiration is None:
+                await self._api_login()
+            elif (self.token_expiration - datetime.now()).total_seconds() < 300:
+                await self._api_login()
+
+    async def _get_portal_token(self, response, type) -> str:
+        """Pull the anti-forgery token out of the login or configure page."""
+        form = (_LOGIN_FORM_RE if type == 1 else _GAF_FORM_RE).search(response)
+        if form is not None:
+            hidden_input = _HIDDEN_INPUT_RE.search(form.group(1))
+            if hidden_input is not None:
+                value = _VALUE_ATTR_RE.search(hidden_input.group(0))
+                if value is not None:
+                    self._GAFToken = value.group(1)
+                    return self._GAFToken
+        #Fall back to a full parse if the markup doesn't look as expected
         soup = BeautifulSoup(response , features="html.parser")
         if type == 1:
             form = soup.find("form", class_="login-form")
@@ -952,52 +1197,53 @@ class RedbackTechClient:
             form = soup.find('form', id='GlobalAntiForgeryToken')
         hidden_input = form.find("input", type="hidden")
         self._GAFToken = hidden_input.attrs['value']
-        return
+        return self._GAFToken
+
+    async def _portal_request(self, method: str, url: str, **kwargs: Any) -> str:
+        """Make a Portal call, raising RedbackTechClientError on an error status without reading the body."""
+        try:
+            async with self._session2.request(method, url, timeout=self._timeout, raise_for_status=True, **kwargs) as resp:
+                return await self._portal_response(resp)
+        except ClientResponseError as error:
+            raise RedbackTechClientError(f'RedbackTech Portal Error Encountered. Status: {error.status}; Error: {error.message}') from error
 
-    async def _portal_post(self, url: str, headers: dict[str, Any], data ) -> dict[str, Any]:
+    async def _portal_post(self, url: str, headers: dict[str, Any], data ) -> str:
         """Make POST Portal call."""
-        async with self._session2.post(url, headers=headers, data=data, timeout=self.timeout) as resp:
-            return await self._portal_response(resp)
+        return await self._portal_request('POST', url, headers=headers, data=data)
 
-    async def _portal_get(self, url: str, headers: dict[str, Any], data: dict[str, Any]) -> dict[str, Any]:
+    async def _portal_get(self, url: str, headers: dict[str, Any], data: dict[str, Any]) -> str:
         """Make GET Portal call."""
-        async with self._session2.get(url, headers=headers, data=data, timeout=self.timeout) as resp:
-            return await self._portal_response(resp)
+        return await self._portal_request('GET', url, headers=headers, data=data)
 
-    async def _portal_delete(self, url: str, headers: dict[str, Any], data: dict[str, Any]) -> dict[str, Any]:
-        """Make GET Portal call."""
-        async with self._session2.delete(url, headers=headers, data=data, timeout=self.timeout) as resp:
-            return await self._portal_response(resp)
+    async def _portal_delete(self, url: str, headers: dict[str, Any], data: dict[str, Any]) -> str:
+        """Make DELETE Portal call."""
+        return await self._portal_request('DELETE', url, headers=headers, data=data)
 
     @staticmethod
-    async def _portal_response(resp: ClientResponse):
+    async def _portal_response(resp: ClientResponse) -> str:
         """Return response from Portal call."""
         LOGGER.debug('Portal Response: %s', resp)
-        if resp.status != 200:
-            error = await resp.text()
-            raise RedbackTechClientError(f'RedbackTech API Error Encountered. Status: {resp.status}; Error: {error}')
         try:
-            response: dict[str, Any] = await resp.text()
+            response: str = await resp.text()
         except Exception as error:
             raise RedbackTechClientError(f'Could not return text {error}') from error
         return response
 
-    async def _create_device_info_inverter(self, data) -> None:
-        id_temp = data['Data']['Nodes'][0]['StaticData']['Id']
-        id_temp = id_temp[-4:] + 'inv'
-        id_temp = id_temp.lower()
+    def _create_device_info_inverter(self, data) -> None:
+        node_static = data['Data']['Nodes'][0]['StaticData']
+        id_temp = self._device_id(node_static['Id'], 'inv')
         data_dict = {
             'identifiers': id_temp,
-            'name': data['Data']['Nodes'][0]['StaticData']['ModelName'] + ' - inverter',
-            'model': data['Data']['Nodes'][0]['StaticData']['ModelName'],
-            'sw_version': data['Data']['Nodes'][0]['StaticData']['SoftwareVersion'],
-            'hw_version': data['Data']['Nodes'][0]['StaticData']['FirmwareVersion'],
-            'serial_number': data['Data']['Nodes'][0]['StaticData']['Id'],
+            'name': node_static['ModelName'] + ' - inverter',
+            'model': node_static['ModelName'],
+            'sw_version': node_static['SoftwareVersion'],
+            'hw_version': node_static['FirmwareVersion'],
+            'serial_number': node_static['Id'],
         }
         self._redback_device_info.append(data_dict)
-        return
+        self._redback_device_info_by_id[id_temp] = data_dict
 
-    async def _create_device_info_op_env(self) -> None:
+    def _create_device_info_op_env(self) -> None:
         for site in self._redback_site_ids:
             id_temp = site[-4:] + 'env'
             data_dict = {
@@ -1009,46 +1255,41 @@ class RedbackTechClient:
                 'serial_number': site,
             }
             self._redback_device_info.append(data_dict)
-        return
+            self._redback_device_info_by_id[id_temp] = data_dict
 
-    async def _create_device_info_battery(self, data) -> None:
-        id_temp = data['Data']['Nodes'][0]['StaticData']['Id']
-        id_temp = id_temp[-4:] + 'bat'
-        id_temp = id_temp.lower()
+    def _create_device_info_battery(self, data) -> None:
+        node_static = data['Data']['Nodes'][0]['StaticData']
+        id_temp = self._device_id(node_static['Id'], 'bat')
         data_dict = {
             'identifiers': id_temp,
-            'name': data['Data']['Nodes'][0]['StaticData']['ModelName'] + ' - battery',
-            'model': data['Data']['Nodes'][0]['StaticData']['ModelName'],
-            'sw_version': data['Data']['Nodes'][0]['StaticData']['SoftwareVersion'],
-            'hw_version': data['Data']['Nodes'][0]['StaticData']['FirmwareVersion'],
-            'serial_number': data['Data']['Nodes'][0]['StaticData']['Id'],
+            'name': node_static['ModelName'] + ' - battery',
+            'model': node_static['ModelName'],
+            'sw_version': node_static['SoftwareVersion'],
+            'hw_version': node_static['FirmwareVersion'],
+            'serial_number': node_static['Id'],
         }
         self._redback_device_info.append(data_dict)
-        return
+        self._redback_device_info_by_id[id_temp] = data_dict
 
-    async def _create_op_env_datetime_entities(self, device_id, site) -> None:
+    def _create_op_env_datetime_entities(self, device_id, site) -> None:
         if self._redback_op_env_create_settings.get(device_id) is None:
-            self._redback_op_env_create_settings.update([(device_id,{'EventId': '','MaxImportPowerW': 10000,'MaxExportPowerW': 10000,'MaxDischargePowerW': 10000,'MaxChargePowerW': 10000,'MaxGenerationPowerVA': 10000, 'StartAtUtc': datetime.now(timezone.utc), 'EndAtUtc': datetime.now(timezone.utc) + timedelta(hours=1), 'SiteId': site})])
+            self._redback_op_env_create_settings[device_id] = {'EventId': '','MaxImportPowerW': 10000,'MaxExportPowerW': 10000,'MaxDischargePowerW': 10000,'MaxChargePowerW': 10000,'MaxGenerationPowerVA': 10000, 'StartAtUtc': _UTCNOW(_UTC), 'EndAtUtc': _UTCNOW(_UTC) + timedelta(hours=1), 'SiteId': site}
         data_dict = {'value': self._redback_op_env_create_settings[device_id]['StartAtUtc'], 'entity_name': 'op_env_create_start_time', 'device_id': device_id, 'device_type': 'OperatingEnvelope', 'type_set': 'datetime.datetime' }
         self._redback_schedule_datetime.append(data_dict)
         data_dict = {'value': self._redback_op_env_create_settings[device_id]['EndAtUtc'], 'entity_name': 'op_env_create_end_time', 'device_id': device_id, 'device_type': 'OperatingEnvelope', 'type_set': 'datetime.datetime' }
         self._redback_schedule_datetime.append(data_dict)
-        return
 
-    async def _create_datetime_entities(self, data) -> None:
-        id_temp = data['Data']['Nodes'][0]['StaticData']['Id']
-        id_temp = id_temp[-4:] + 'inv'
-        id_temp = id_temp.lower()
+    def _create_datetime_entities(self, data) -> None:
+        id_temp = self._device_id(data['Data']['Nodes'][0]['StaticData']['Id'], 'inv')
 
         if self._inverter_control_settings.get(id_temp) is None:    
-            self._inverter_control_settings.update([(id_temp,{'power_setting_watts': 0,'power_setting_duration': 0,'power_setting_mode':'ChargeBattery', 'start_time': datetime.now(timezone.utc)})])
-        data_dict = {'value': self._inverter_control_settings[id_temp]['start_time'], 'entity_name': 'schedule_create_start_time', 'device_id': id_temp, 'device_type': 'inverter', 'type_set': 'datetime.datetime' }
+            self._inverter_control_settings[id_temp] = {'power_setting_watts': 0,'power_setting_duration': 0,'power_setting_mode':'ChargeBattery', 'start_time': _UTCNOW(_UTC)}
+        data_dict = {'value': self._inverter_control_settings[id_temp]['start_time'], 'entity_name': 'schedule_create_start_time', 'device_id': id_temp, 'device_type': _INVERTER, 'type_set': 'datetime.datetime' }
         self._redback_schedule_datetime.append(data_dict)
-        return
 
-    async def _create_op_env_number_entities(self, device_id, site) -> None:
+    def _create_op_env_number_entities(self, device_id, site) -> None:
         if self._redback_op_env_create_settings.get(device_id) is None:
-            self._redback_op_env_create_settings.update([(device_id,{'EventId': '','MaxImportPowerW': 10000,'MaxExportPowerW': 10000,'MaxDischargePowerW': 10000,'MaxChargePowerW': 10000,'MaxGenerationPowerVA': 10000, 'StartAtUtc': datetime.now(timezone.utc), 'EndAtUtc': datetime.now(timezone.utc) + timedelta(hours=1), 'SiteId': site})])
+            self._redback_op_env_create_settings[device_id] = {'EventId': '','MaxImportPowerW': 10000,'MaxExportPowerW': 10000,'MaxDischargePowerW': 10000,'MaxChargePowerW': 10000,'MaxGenerationPowerVA': 10000, 'StartAtUtc': _UTCNOW(_UTC), 'EndAtUtc': _UTCNOW(_UTC) + timedelta(hours=1), 'SiteId': site}
         data_dict = {'value': self._redback_op_env_create_settings[device_id]['MaxImportPowerW'], 'entity_name': 'op_env_create_max_import', 'device_id': device_id, 'device_type': 'OperatingEnvelope', 'type_set': 'number.string' }
         self._redback_numbers.append(data_dict)
         data_dict = {'value': self._redback_op_env_create_settings[device_id]['MaxExportPowerW'], 'entity_name': 'op_env_create_max_export', 'device_id': device_id, 'device_type': 'OperatingEnvelope', 'type_set': 'number.string' }
@@ -1059,568 +1300,281 @@ class RedbackTechClient:
         self._redback_numbers.append(data_dict)
         data_dict = {'value': self._redback_op_env_create_settings[device_id]['MaxGenerationPowerVA'], 'entity_name': 'op_env_create_max_generation', 'device_id': device_id, 'device_type': 'OperatingEnvelope', 'type_set': 'number.string' }
         self._redback_numbers.append(data_dict)
-        return
 
-    async def _create_op_env_text_entities(self, device_id, site) -> None:
+    def _create_op_env_text_entities(self, device_id, site) -> None:
         if self._redback_op_env_create_settings.get(device_id) is None:    
-            self._redback_op_env_create_settings.update([(device_id,{'EventId': '','MaxImportPowerW': 10000,'MaxExportPowerW': 10000,'MaxDischargePowerW': 10000,'MaxChargePowerW': 10000,'MaxGenerationPowerVA': 10000, 'StartAtUtc': datetime.now(timezone.utc), 'EndAtUtc': datetime.now(timezone.utc) + timedelta(hours=1), 'SiteId': site})])
+            self._redback_op_env_create_settings[device_id] = {'EventId': '','MaxImportPowerW': 10000,'MaxExportPowerW': 10000,'MaxDischargePowerW': 10000,'MaxChargePowerW': 10000,'MaxGenerationPowerVA': 10000, 'StartAtUtc': _UTCNOW(_UTC), 'EndAtUtc': _UTCNOW(_UTC) + timedelta(hours=1), 'SiteId': site}
         data_dict = {'value': self._redback_op_env_create_settings[device_id]['EventId'], 'entity_name': 'op_env_create_event_id', 'device_id': device_id, 'device_type': 'OperatingEnvelope', 'type_set': 'text.string' }
         self._redback_text.append(data_dict)
-        return
         
-    async def _create_number_entities(self, data) -> None:
-        id_temp = data['Data']['Nodes'][0]['StaticData']['Id']
-        id_temp = id_temp[-4:] + 'inv'
-        id_temp = id_temp.lower()
+    def _create_number_entities(self, data) -> None:
+        id_temp = self._device_id(data['Data']['Nodes'][0]['StaticData']['Id'], 'inv')
 
         if self._inverter_control_settings.get(id_temp) is None:
-            self._inverter_control_settings.update([(id_temp,{'power_setting_watts': 0,'power_setting_duration': 0,'power_setting_mode':'ChargeBattery', 'start_time': datetime.now(timezone.utc)})])
-        data_dict = {'value': self._inverter_control_settings[id_temp]['power_setting_duration'], 'entity_name': 'power_setting_duration', 'device_id': id_temp, 'device_type': 'inverter', 'type_set': 'number.string' }
+            self._inverter_control_settings[id_temp] = {'power_setting_watts': 0,'power_setting_duration': 0,'power_setting_mode':'ChargeBattery', 'start_time': _UTCNOW(_UTC)}
+        data_dict = {'value': self._inverter_control_settings[id_temp]['power_setting_duration'], 'entity_name': 'power_setting_duration', 'device_id': id_temp, 'device_type': _INVERTER, 'type_set': 'number.string' }
         self._redback_numbers.append(data_dict)
-        data_dict = {'value': self._inverter_control_settings[id_temp]['power_setting_watts'], 'entity_name': 'power_setting_watts', 'device_id': id_temp, 'device_type': 'inverter', 'type_set': 'number.string' }
+        data_dict = {'value': self._inverter_control_settings[id_temp]['power_setting_watts'], 'entity_name': 'power_setting_watts', 'device_id': id_temp, 'device_type': _INVERTER, 'type_set': 'number.string' }
         self._redback_numbers.append(data_dict)
-        return
 
-    async def _create_select_entities(self, data, data2) -> None:
-        id_temp = data['Data']['Nodes'][0]['StaticData']['Id']
-        id_temp = id_temp[-4:] + 'inv'
-        id_temp = id_temp.lower()
+    def _create_select_entities(self, data, data2) -> None:
+        id_temp = self._device_id(data['Data']['Nodes'][0]['StaticData']['Id'], 'inv')
         if self._inverter_control_settings.get(id_temp) is None:
-            self._inverter_control_settings.update([(id_temp,{'power_setting_watts': 0,'power_setting_duration': 0,'power_setting_mode':'ChargeBattery'})])
-        data_dict = {'value': self._inverter_control_settings[id_temp]['power_setting_mode'], 'entity_name': 'power_setting_mode', 'device_id': id_temp, 'device_type': 'inverter', 'type_set': 'select.string', 'options': INVERTER_MODES }
+            self._inverter_control_settings[id_temp] = {'power_setting_watts': 0,'power_setting_duration': 0,'power_setting_mode':'ChargeBattery'}
+        data_dict = {'value': self._inverter_control_settings[id_temp]['power_setting_mode'], 'entity_name': 'power_setting_mode', 'device_id': id_temp, 'device_type': _INVERTER, 'type_set': 'select.string', 'options': INVERTER_MODES }
         self._redback_selects.append(data_dict)
         if self._redback_schedule_selected.get(id_temp) is None:
-            self._redback_schedule_selected.update([(id_temp,{'schedule_selector': None})])
+            self._redback_schedule_selected[id_temp] = {'schedule_selector': None}
         if self._redback_schedules is not None:
-            schedule_options=[]
-            for schedule in self._redback_schedules:
-                if schedule['device_id'] == id_temp:
-                    schedule_options.append(schedule['schedule_selector'])
-            data_dict = {'value': self._redback_schedule_selected[id_temp]['schedule_selector'], 'entity_name': 'schedule_id_selected', 'device_id': id_temp, 'device_type': 'inverter', 'type_set': 'select.string', 'options': schedule_options}
+            schedule_options = self._schedules_by_device.get(id_temp, [])
+            data_dict = {'value': self._redback_schedule_selected[id_temp]['schedule_selector'], 'entity_name': 'schedule_id_selected', 'device_id': id_temp, 'device_type': _INVERTER, 'type_set': 'select.string', 'options': schedule_options}
         else:
-            data_dict = {'value': None, 'entity_name': 'schedule_id_selected', 'device_id': id_temp, 'device_type': 'inverter', 'type_set': 'select.string', 'options': None}
+            data_dict = {'value': None, 'entity_name': 'schedule_id_selected', 'device_id': id_temp, 'device_type': _INVERTER, 'type_set': 'select.string', 'options': None}
         self._redback_selects.append(data_dict)
-        return
 
-    async def _create_op_env_select_entities(self, site, device_id) -> None:
+    def _create_op_env_select_entities(self, site, device_id) -> None:
         if self._redback_op_env_selected.get(device_id) is None:
-            self._redback_op_env_selected.update([(device_id,{'schedule_selector': None})])
+            self._redback_op_env_selected[device_id] = {'schedule_selector': None}
         if self._redback_open_env_data is not None:
             schedule_options=[]
             for schedule in self._redback_open_env_data:
                 if schedule['data']['SiteId'] == site:
                     schedule_options.append(schedule['data']['schedule_selector'])
-            data_dict = {'value': self._redback_op_env_selected[device_id]['schedule_selector'], 'entity_name': 'op_env_id_selected', 'device_id': device_id, 'device_type': 'inverter', 'type_set': 'select.string', 'options': schedule_options}
+            data_dict = {'value': self._redback_op_env_selected[device_id]['schedule_selector'], 'entity_name': 'op_env_id_selected', 'device_id': device_id, 'device_type': _INVERTER, 'type_set': 'select.string', 'options': schedule_options}
         else:
-            data_dict = {'value': None, 'entity_name': 'op_env_id_selected', 'device_id': device_id, 'device_type': 'inverter', 'type_set': 'select.string', 'options': None}
+            data_dict = {'value': None, 'entity_name': 'op_env_id_selected', 'device_id': device_id, 'device_type': _INVERTER, 'type_set': 'select.string', 'options': None}
         self._redback_selects.append(data_dict)
-        return
 
-    async def _create_op_env_status_entities(self, site, device_id, schedule_count) -> None:
+    def _create_op_env_status_entities(self, site, device_id, schedule_count) -> None:
         data_dict = {'value': self._redback_op_env_data[site], 'entity_name': 'op_env_has_env', 'device_id': device_id, 'device_type': 'OperatingEnvelope', 'type_set': 'select.string'}
         self._redback_entities.append(data_dict)
         data_dict = {'value': schedule_count, 'entity_name': 'op_env_count', 'device_id': device_id, 'device_type': 'OperatingEnvelope', 'type_set': 'select.string'}
         self._redback_entities.append(data_dict)
-        return
 
-    async def _convert_responses_to_schedule_entities(self, data, data2) -> None:
-        id_temp = data2['Data']['Nodes'][0]['StaticData']['Id']
-        id_temp = id_temp[-4:] + 'inv'
-        id_temp = id_temp.lower()
-        temp_timenow = datetime.now(timezone.utc)
+    def _convert_responses_to_schedule_entities(self, data, data2) -> None:
+        #Collect into a local list and hand it over in one extend at the end
+        entities = []
+        append_entity = entities.append
+        id_temp = self._device_id(data2['Data']['Nodes'][0]['StaticData']['Id'], 'inv')
+        temp_timenow = _UTCNOW(_UTC)
         temp_active_event = False
-        if len(data['Data']['Schedules']) != 0:
-            for schedule in data['Data']['Schedules']:
-                days =0
-                if schedule['Duration'].find('.')> -1:
-                    days = int(schedule['Duration'].split('.')[0]) *24*60
-                    schedule['Duration'] = schedule['Duration'].split('.')[1]
-                schedule['Duration'] = int(schedule['Duration'].split(':')[0])*60 + int(schedule['Duration'].split(':')[1]) + days
-                end_time = (datetime.fromisoformat((schedule['StartTimeUtc']).replace('Z','+00:00')) + timedelta(minutes=schedule['Duration']))
+        schedules = data['Data']['Schedules']
+        #Index the selectors by device as we go so _create_select_entities doesn't rescan every schedule
+        schedule_selectors = self._schedules_by_device.setdefault(id_temp, [])
+        append_schedule = self._redback_schedules.append
+        index_schedule = self._schedules_by_selector.setdefault
+        if len(schedules) != 0:
+            for schedule in schedules:
+                #The response may be cached and reused, so parse the duration into a local rather than in place
+                days, sep, duration = schedule['Duration'].partition('.')
+                if not sep:
+                    days, duration = '0', days
+                hours, _, minutes = duration.partition(':')
+                minutes = minutes.partition(':')[0]
+                duration = int(days)*24*60 + int(hours)*60 + int(minutes)
+                start_time = datetime.fromisoformat(schedule['StartTimeUtc'].replace('Z','+00:00'))
+                end_time = start_time + timedelta(minutes=duration)
                 data_dict = {
-                    'schedule_selector': str((datetime.fromisoformat((schedule['StartTimeUtc']).replace('Z','+00:00'))).astimezone())[:16] +'-' + schedule['DesiredMode']['InverterMode'],
+                    'schedule_selector': str(start_time.astimezone())[:16] +'-' + schedule['DesiredMode']['InverterMode'],
                     'schedule_id': schedule['ScheduleId'],
                     'serial_number': schedule['SerialNumber'],
                     'siteid': schedule['SiteId'],
-                    'start_time_utc': datetime.fromisoformat((schedule['StartTimeUtc']).replace('Z','+00:00')),
+                    'start_time_utc': start_time,
                     'end_time': end_time,
-                    'duration': schedule['Duration'],
+                    'duration': duration,
                     'inverter_mode': schedule['DesiredMode']['InverterMode'],
                     'power_w': schedule['DesiredMode']['ArgumentInWatts'],   
                     'device_id': id_temp,
-                    'device_type': 'inverter',         
+                    'device_type': _INVERTER,         
                 }
-                self._redback_schedules.append(data_dict)
-                if temp_timenow >= datetime.fromisoformat((schedule['StartTimeUtc']).replace('Z','+00:00')) and temp_timenow <= end_time:
+                append_schedule(data_dict)
+                schedule_selectors.append(data_dict['schedule_selector'])
+                index_schedule(data_dict['schedule_selector'], data_dict)
+                if start_time <= temp_timenow <= end_time:
                     temp_active_event = True
-                    active_event = {'value': datetime.fromisoformat((schedule['StartTimeUtc']).replace('Z','+00:00')), 'entity_name': 'active_event_start_time', 'device_id': id_temp, 'device_type': 'inverter', 'type_set': 'datetime.datetime' }
-                    self._redback_entities.append(active_event)
-                    active_event = {'value': end_time, 'entity_name': 'active_event_end_time', 'device_id': id_temp, 'device_type': 'inverter', 'type_set': 'datetime.datetime' }
-                    self._redback_entities.append(active_event)
-                    active_event = {'value': schedule['Duration'], 'entity_name': 'active_event_duration', 'device_id': id_temp, 'device_type': 'inverter', 'type_set': 'number.string' }
-                    self._redback_entities.append(active_event)
-                    active_event = {'value': schedule['DesiredMode']['InverterMode'], 'entity_name': 'active_event_inverter_mode', 'device_id': id_temp, 'device_type': 'inverter', 'type_set': 'select.string', 'options': INVERTER_MODES }
-                    self._redback_entities.append(active_event)
-                    active_event = {'value': schedule['DesiredMode']['ArgumentInWatts'], 'entity_name': 'active_event_power_w', 'device_id': id_temp, 'device_type': 'inverter', 'type_set': 'number.string' }
-                    self._redback_entities.append(active_event)
-                    active_event = {'value': schedule['ScheduleId'], 'entity_name': 'active_event_schedule_id', 'device_id': id_temp, 'device_type': 'inverter', 'type_set': 'number.string' }
-                    self._redback_entities.append(active_event)
-                    active_event = {'value': True, 'entity_name': 'active_event', 'device_id': id_temp, 'device_type': 'inverter', 'type_set': 'number.string' }
-                    self._redback_entities.append(active_event)
-        if temp_active_event is False:    
-            active_event = {'value': None, 'entity_name': 'active_event_start_time', 'device_id': id_temp, 'device_type': 'inverter', 'type_set': 'datetime.datetime' }
-            self._redback_entities.append(active_event)
-            active_event = {'value': None, 'entity_name': 'active_event_end_time', 'device_id': id_temp, 'device_type': 'inverter', 'type_set': 'datetime.datetime' }
-            self._redback_entities.append(active_event)
-            active_event = {'value': 0, 'entity_name': 'active_event_duration', 'device_id': id_temp, 'device_type': 'inverter', 'type_set': 'number.string' }
-            self._redback_entities.append(active_event)
-            active_event = {'value': None, 'entity_name': 'active_event_inverter_mode', 'device_id': id_temp, 'device_type': 'inverter', 'type_set': 'select.string', 'options': INVERTER_MODES }
-            self._redback_entities.append(active_event)
-            active_event = {'value': 0, 'entity_name': 'active_event_power_w', 'device_id': id_temp, 'device_type': 'inverter', 'type_set': 'number.string' }
-            self._redback_entities.append(active_event)
-            active_event = {'value': None, 'entity_name': 'active_event_schedule_id', 'device_id': id_temp, 'device_type': 'inverter', 'type_set': 'number.string' }
-            self._redback_entities.append(active_event)
-            active_event = {'value': False, 'entity_name': 'active_event', 'device_id': id_temp, 'device_type': 'inverter', 'type_set': 'number.string' }
-            self._redback_entities.append(active_event)
-        return
-
-    async def _convert_responses_to_inverter_entities(self, data, data2) -> None:
+                    append_entity({'value': start_time, 'entity_name': 'active_event_start_time', 'device_id': id_temp, 'device_type': _INVERTER, 'type_set': 'datetime.datetime' })
+                    append_entity({'value': end_time, 'entity_name': 'active_event_end_time', 'device_id': id_temp, 'device_type': _INVERTER, 'type_set': 'datetime.datetime' })
+                    append_entity({'value': duration, 'entity_name': 'active_event_duration', 'device_id': id_temp, 'device_type': _INVERTER, 'type_set': 'number.string' })
+                    append_entity({'value': schedule['DesiredMode']['InverterMode'], 'entity_name': 'active_event_inverter_mode', 'device_id': id_temp, 'device_type': _INVERTER, 'type_set': 'select.string', 'options': INVERTER_MODES })
+                    append_entity({'value': schedule['DesiredMode']['ArgumentInWatts'], 'entity_name': 'active_event_power_w', 'device_id': id_temp, 'device_type': _INVERTER, 'type_set': 'number.string' })
+                    append_entity({'value': schedule['ScheduleId'], 'entity_name': 'active_event_schedule_id', 'device_id': id_temp, 'device_type': _INVERTER, 'type_set': 'number.string' })
+                    append_entity({'value': True, 'entity_name': 'active_event', 'device_id': id_temp, 'device_type': _INVERTER, 'type_set': 'number.string' })
+        if not temp_active_event:
+            append_entity({'value': None, 'entity_name': 'active_event_start_time', 'device_id': id_temp, 'device_type': _INVERTER, 'type_set': 'datetime.datetime' })
+            append_entity({'value': None, 'entity_name': 'active_event_end_time', 'device_id': id_temp, 'device_type': _INVERTER, 'type_set': 'datetime.datetime' })
+            append_entity({'value': 0, 'entity_name': 'active_event_duration', 'device_id': id_temp, 'device_type': _INVERTER, 'type_set': 'number.string' })
+            append_entity({'value': None, 'entity_name': 'active_event_inverter_mode', 'device_id': id_temp, 'device_type': _INVERTER, 'type_set': 'select.string', 'options': INVERTER_MODES })
+            append_entity({'value': 0, 'entity_name': 'active_event_power_w', 'device_id': id_temp, 'device_type': _INVERTER, 'type_set': 'number.string' })
+            append_entity({'value': None, 'entity_name': 'active_event_schedule_id', 'device_id': id_temp, 'device_type': _INVERTER, 'type_set': 'number.string' })
+            append_entity({'value': False, 'entity_name': 'active_event', 'device_id': id_temp, 'device_type': _INVERTER, 'type_set': 'number.string' })
+        self._redback_entities.extend(entities)
+
+    def _static_entities_for(self, id_temp: str, data: dict[str, Any], sections: dict[str, Any], device_type: str, sensor_specs: tuple, static_specs: tuple) -> list[dict[str, Any]]:
+        """Return the entities built only from the static response, reused while that response is the cached one."""
+        #The static cache hands back the same response object until it expires, so identity means nothing changed
+        cached = self._static_entities.get(id_temp)
+        if cached is not None and cached[0] is data:
+            return cached[1]
+        entities = [{'value': sections[section][key], 'entity_name': entity_name, 'device_id': id_temp, 'device_type': device_type, 'type_set': 'sensor.string'} for entity_name, section, key in sensor_specs]
+        entities.extend({'value': sections[section][key], 'entity_name': entity_name, 'device_id': id_temp, 'device_type': device_type} for entity_name, section, key in static_specs)
+        self._static_entities[id_temp] = (data, entities)
+        return entities
+
+    def _convert_responses_to_inverter_entities(self, data, data2) -> None:
         """Convert responses to entities."""
-        pvId =1
-        id_temp = data['Data']['Nodes'][0]['StaticData']['Id']
-        id_temp = id_temp[-4:] + 'inv'
-        id_temp = id_temp.lower()
-        data_dict = {'value': data['Data']['Nodes'][0]['StaticData']['ModelName'], 'entity_name': 'model_name', 'device_id': id_temp, 'device_type': 'inverter', 'type_set': 'sensor.string' }
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data['Data']['Nodes'][0]['StaticData']['Id'], 'entity_name': 'serial_number', 'device_id': id_temp, 'device_type': 'inverter', 'type_set': 'sensor.string' }
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data['Data']['StaticData']['Location']['Latitude'], 'entity_name': 'latitude', 'device_id': id_temp, 'device_type': 'inverter', 'type_set': 'sensor.string' }
-        self._redback_entities.append(data_dict)
-        data_dict = { 'value': data['Data']['StaticData']['Location']['Longitude'], 'entity_name': 'longitude', 'device_id': id_temp, 'device_type': 'inverter', 'type_set': 'sensor.string' }
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data['Data']['StaticData']['RemoteAccessConnection']['Type'],'entity_name': 'network_connection', 'device_id': id_temp, 'device_type': 'inverter'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data['Data']['StaticData']['ApprovedCapacityW'],'entity_name': 'approved_capacity_w', 'device_id': id_temp, 'device_type': 'inverter'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data['Data']['StaticData']['SiteDetails']['GenerationHardLimitVA'],'entity_name': 'generation_hard_limit_va', 'device_id': id_temp, 'device_type': 'inverter'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data['Data']['StaticData']['SiteDetails']['GenerationSoftLimitVA'],'entity_name': 'generation_soft_limit_va', 'device_id': id_temp, 'device_type': 'inverter'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data['Data']['StaticData']['SiteDetails']['ExportHardLimitkW'],'entity_name': 'export_hard_limit_kw', 'device_id': id_temp, 'device_type': 'inverter'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data['Data']['StaticData']['SiteDetails']['ExportSoftLimitkW'],'entity_name': 'export_soft_limit_kw', 'device_id': id_temp, 'device_type': 'inverter'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data['Data']['StaticData']['SiteDetails']['SiteExportLimitkW'],'entity_name': 'site_export_limit_kw', 'device_id': id_temp, 'device_type': 'inverter'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data['Data']['StaticData']['SiteDetails']['PanelModel'],'entity_name': 'pv_panel_model', 'device_id': id_temp, 'device_type': 'inverter'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data['Data']['StaticData']['SiteDetails']['PanelSizekW'],'entity_name': 'pv_panel_size_kw', 'device_id': id_temp, 'device_type': 'inverter'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data['Data']['StaticData']['SiteDetails']['SystemType'],'entity_name': 'system_type', 'device_id': id_temp, 'device_type': 'inverter'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data['Data']['StaticData']['SiteDetails']['InverterMaxExportPowerkW'],'entity_name': 'inverter_max_export_power_kw', 'device_id': id_temp, 'device_type': 'inverter'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data['Data']['StaticData']['SiteDetails']['InverterMaxImportPowerkW'],'entity_name': 'inverter_max_import_power_kw', 'device_id': id_temp, 'device_type': 'inverter'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data['Data']['StaticData']['CommissioningDate'],'entity_name': 'commissioning_date', 'device_id': id_temp, 'device_type': 'inverter'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data['Data']['StaticData']['NMI'],'entity_name': 'nmi', 'device_id': id_temp, 'device_type': 'inverter'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data['Data']['StaticData']['Id'],'entity_name': 'site_id', 'device_id': id_temp, 'device_type': 'inverter'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data['Data']['StaticData']['Type'],'entity_name': 'inverter_site_type', 'device_id': id_temp, 'device_type': 'inverter'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data['Data']['Nodes'][0]['StaticData']['BatteryCount'],'entity_name': 'battery_count', 'device_id': id_temp, 'device_type': 'inverter'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data['Data']['Nodes'][0]['StaticData']['SoftwareVersion'],'entity_name': 'software_version', 'device_id': id_temp, 'device_type': 'inverter'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data['Data']['Nodes'][0]['StaticData']['FirmwareVersion'],'entity_name': 'firmware_version', 'device_id': id_temp, 'device_type': 'inverter'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': datetime.fromisoformat((data2['Data']['TimestampUtc']).replace('Z','+00:00')),'entity_name': 'timestamp_utc', 'device_id': id_temp, 'device_type': 'inverter'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data2['Data']['FrequencyInstantaneousHz'],'entity_name': 'frequency_instantaneous', 'device_id': id_temp, 'device_type': 'inverter'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data2['Data']['PvPowerInstantaneouskW'],'entity_name': 'pv_power_instantaneous_kw', 'device_id': id_temp, 'device_type': 'inverter'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data2['Data']['InverterTemperatureC'],'entity_name': 'inverter_temperature_c', 'device_id': id_temp, 'device_type': 'inverter'}
-        self._redback_entities.append(data_dict)
-        if data2['Data']['PvAllTimeEnergykWh'] is not None:
-            data_dict = {'value': (data2['Data']['PvAllTimeEnergykWh'])/1000,'entity_name': 'pv_all_time_energy_mwh', 'device_id': id_temp, 'device_type': 'inverter'}
-        else:
-            data_dict = {'value': data2['Data']['PvAllTimeEnergykWh'],'entity_name': 'pv_all_time_energy_mwh', 'device_id': id_temp, 'device_type': 'inverter'}
-        self._redback_entities.append(data_dict)
-        if data2['Data']['ExportAllTimeEnergykWh'] is not None:
-            data_dict = {'value': (data2['Data']['ExportAllTimeEnergykWh'])/1000,'entity_name': 'export_all_time_energy_mwh', 'device_id': id_temp, 'device_type': 'inverter'}
-        else:
-            data_dict = {'value': data2['Data']['ExportAllTimeEnergykWh'],'entity_name': 'export_all_time_energy_mwh', 'device_id': id_temp, 'device_type': 'inverter'}
-        self._redback_entities.append(data_dict)
-        if data2['Data']['ImportAllTimeEnergykWh'] is not None:
-            data_dict = {'value': (data2['Data']['ImportAllTimeEnergykWh'])/1000,'entity_name': 'import_all_time_energy_mwh', 'device_id': id_temp, 'device_type': 'inverter'}
-        else:
-            data_dict = {'value': data2['Data']['ImportAllTimeEnergykWh'],'entity_name': 'import_all_time_energy_mwh', 'device_id': id_temp, 'device_type': 'inverter'}  
-        self._redback_entities.append(data_dict)
-        if data2['Data']['LoadAllTimeEnergykWh'] is not None:
-            data_dict = {'value': (data2['Data']['LoadAllTimeEnergykWh'])/1000,'entity_name': 'load_all_time_energy_mwh', 'device_id': id_temp, 'device_type': 'inverter'}   
-        else:
-            data_dict = {'value': data2['Data']['LoadAllTimeEnergykWh'],'entity_name': 'load_all_time_energy_mwh', 'device_id': id_temp, 'device_type': 'inverter'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data2['Data']['Status'],'entity_name': 'status', 'device_id': id_temp, 'device_type': 'inverter'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data2['Data']['Inverters'][0]['PowerMode']['InverterMode'],'entity_name': 'power_mode_inverter_mode', 'device_id': id_temp, 'device_type': 'inverter'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data2['Data']['Inverters'][0]['PowerMode']['PowerW'],'entity_name': 'power_mode_power_w', 'device_id': id_temp, 'device_type': 'inverter'}
-        self._redback_entities.append(data_dict)
-        for pv in data2['Data']['PVs']:
-            entity_name_temp = f'mppt_{pvId}_current_a'
-            data_dict = {'value': pv['CurrentA'],'entity_name': entity_name_temp, 'device_id': id_temp, 'device_type': 'inverter'}
-            self._redback_entities.append(data_dict)
-            entity_name_temp = f'mppt_{pvId}_voltage_v'
-            data_dict = {'value': pv['VoltageV'],'entity_name': entity_name_temp, 'device_id': id_temp, 'device_type': 'inverter'}
-            self._redback_entities.append(data_dict)
-            entity_name_temp = f'mppt_{pvId}_power_kw'
-            data_dict = {'value': pv['PowerkW'],'entity_name': entity_name_temp, 'device_id': id_temp, 'device_type': 'inverter'}
-            self._redback_entities.append(data_dict)
-            if data['Data']['Nodes'][0]['StaticData']['Id'] in self._redback_mppt_data:
-                if ("mppt_"+str(pvId)) in self._redback_mppt_data[data['Data']['Nodes'][0]['StaticData']['Id']]:
-                    if "pv_size" in self._redback_mppt_data[data['Data']['Nodes'][0]['StaticData']['Id']]["mppt_"+str(pvId)]:
-                        entity_name_temp = f'mppt_{pvId}_size_kw'
-                        data_dict = {'value': round(float(self._redback_mppt_data[data['Data']['Nodes'][0]['StaticData']['Id']]["mppt_"+str(pvId)]["pv_size"]),3) ,'entity_name': entity_name_temp, 'device_id': id_temp, 'device_type': 'inverter'}
-                        self._redback_entities.append(data_dict)
-                        entity_name_temp = f'mppt_{pvId}_generation_instant'
-                        temp_data =round(( pv['PowerkW'] /float(self._redback_mppt_data[data['Data']['Nodes'][0]['StaticData']['Id']]["mppt_"+str(pvId)]["pv_size"])) * 100,2)
-                        data_dict = {'value': temp_data ,'entity_name': entity_name_temp, 'device_id': id_temp, 'device_type': 'inverter'}
-                        self._redback_entities.append(data_dict)
-                    if "pv_number_panels" in self._redback_mppt_data[data['Data']['Nodes'][0]['StaticData']['Id']]["mppt_"+str(pvId)]:
-                        entity_name_temp = f'mppt_{pvId}_number_panels'
-                        data_dict = {'value': self._redback_mppt_data[data['Data']['Nodes'][0]['StaticData']['Id']]["mppt_"+str(pvId)]["pv_number_panels"] ,'entity_name': entity_name_temp, 'device_id': id_temp, 'device_type': 'inverter'}
-                        self._redback_entities.append(data_dict)
-                    if "pv_panel_direction" in self._redback_mppt_data[data['Data']['Nodes'][0]['StaticData']['Id']]["mppt_"+str(pvId)]:
-                        entity_name_temp = f'mppt_{pvId}_panel_direction'
-                        data_dict = {'value': self._redback_mppt_data[data['Data']['Nodes'][0]['StaticData']['Id']]["mppt_"+str(pvId)]["pv_panel_direction"] ,'entity_name': entity_name_temp, 'device_id': id_temp, 'device_type': 'inverter'}
-                        self._redback_entities.append(data_dict)
-                    
-            pvId += 1
+        entities = []
+        append_entity = entities.append
+        node_static = data['Data']['Nodes'][0]['StaticData']
+        site_static = data['Data']['StaticData']
+        site_details = site_static['SiteDetails']
+        location = site_static['Location']
+        dynamic = data2['Data']
+        serial_number = node_static['Id']
+        id_temp = self._device_id(serial_number, 'inv')
+        sections = {'node': node_static, 'site': site_static, 'details': site_details, 'location': location, 'remote': site_static['RemoteAccessConnection'], 'dynamic': dynamic}
+        entities.extend(self._static_entities_for(id_temp, data, sections, _INVERTER, _INVERTER_SENSOR_SPECS, _INVERTER_STATIC_SPECS))
+        append_entity({'value': datetime.fromisoformat((dynamic['TimestampUtc']).replace('Z','+00:00')),'entity_name': 'timestamp_utc', 'device_id': id_temp, 'device_type': _INVERTER})
+        entities.extend({'value': sections[section][key], 'entity_name': entity_name, 'device_id': id_temp, 'device_type': _INVERTER} for entity_name, section, key in _INVERTER_DYNAMIC_SPECS)
+        for key, entity_name in _INVERTER_ALLTIME_SPECS:
+            value = dynamic[key]
+            append_entity({'value': value/1000 if value is not None else None,'entity_name': entity_name, 'device_id': id_temp, 'device_type': _INVERTER})
+        append_entity({'value': dynamic['Status'],'entity_name': 'status', 'device_id': id_temp, 'device_type': _INVERTER})
+        power_mode = dynamic['Inverters'][0]['PowerMode']
+        append_entity({'value': power_mode['InverterMode'],'entity_name': 'power_mode_inverter_mode', 'device_id': id_temp, 'device_type': _INVERTER})
+        append_entity({'value': power_mode['PowerW'],'entity_name': 'power_mode_power_w', 'device_id': id_temp, 'device_type': _INVERTER})
+        mppt_data = self._redback_mppt_data.get(serial_number)
+        for pvId, pv in enumerate(dynamic['PVs'], 1):
+            mppt_key, current_name, voltage_name, power_name, size_name, generation_name, panels_name, direction_name = _MPPT_NAMES[pvId - 1] if pvId <= len(_MPPT_NAMES) else _mppt_names(pvId)
+            append_entity({'value': pv['CurrentA'],'entity_name': current_name, 'device_id': id_temp, 'device_type': _INVERTER})
+            append_entity({'value': pv['VoltageV'],'entity_name': voltage_name, 'device_id': id_temp, 'device_type': _INVERTER})
+            append_entity({'value': pv['PowerkW'],'entity_name': power_name, 'device_id': id_temp, 'device_type': _INVERTER})
+            mppt = mppt_data.get(mppt_key) if mppt_data is not None else None
+            if mppt is not None:
+                if "pv_size" in mppt:
+                    pv_size = float(mppt["pv_size"])
+                    append_entity({'value': round(pv_size,3) ,'entity_name': size_name, 'device_id': id_temp, 'device_type': _INVERTER})
+                    temp_data =round(( pv['PowerkW'] /pv_size) * 100,2)
+                    append_entity({'value': temp_data ,'entity_name': generation_name, 'device_id': id_temp, 'device_type': _INVERTER})
+                if "pv_number_panels" in mppt:
+                    append_entity({'value': mppt["pv_number_panels"] ,'entity_name': panels_name, 'device_id': id_temp, 'device_type': _INVERTER})
+                if "pv_panel_direction" in mppt:
+                    append_entity({'value': mppt["pv_panel_direction"] ,'entity_name': direction_name, 'device_id': id_temp, 'device_type': _INVERTER})
         phase_count = 0
         phase_voltage_sum = 0
         phase_Current_sum = 0
         phase_power_exported_sum = 0
         phase_power_imported_sum = 0
         phase_power_net_sum = 0
-        for phase in data2['Data']['Phases']:  
-            if phase['VoltageInstantaneousV'] is not None:
+        for phase in dynamic['Phases']:
+            #Read each reading once, the net power is both summed and reported per phase
+            voltage = phase['VoltageInstantaneousV']
+            current = phase['CurrentInstantaneousA']
+            exported = phase['ActiveExportedPowerInstantaneouskW']
+            imported = phase['ActiveImportedPowerInstantaneouskW']
+            net = imported - exported
+            if voltage is not None:
                 phase_count += 1
-                phase_voltage_sum += phase['VoltageInstantaneousV']
-                phase_Current_sum += phase['CurrentInstantaneousA']
-                phase_power_exported_sum += phase['ActiveExportedPowerInstantaneouskW']
-                phase_power_imported_sum += phase['ActiveImportedPowerInstantaneouskW'] 
-                phase_power_net_sum += phase['ActiveImportedPowerInstantaneouskW'] - phase['ActiveExportedPowerInstantaneouskW']
-            phaseAlpha=phase['Id'].lower()
-            entity_name_temp = f'inverter_phase_{phaseAlpha}_active_exported_power_instantaneous_kw'
-            data_dict = {'value': phase['ActiveExportedPowerInstantaneouskW'],'entity_name': entity_name_temp, 'device_id': id_temp, 'device_type': 'inverter'}
-            self._redback_entities.append(data_dict)
-            entity_name_temp = f'inverter_phase_{phaseAlpha}_active_imported_power_instantaneous_kw'
-            data_dict = {'value': phase['ActiveImportedPowerInstantaneouskW'],'entity_name': entity_name_temp, 'device_id': id_temp, 'device_type': 'inverter'}
-            self._redback_entities.append(data_dict)
-            entity_name_temp = f'inverter_phase_{phaseAlpha}_active_net_power_instantaneous_kw'
-            data_dict = {'value': phase['ActiveImportedPowerInstantaneouskW'] - phase['ActiveExportedPowerInstantaneouskW'],'entity_name': entity_name_temp, 'device_id': id_temp, 'device_type': 'inverter'}
-            self._redback_entities.append(data_dict)
-            entity_name_temp = f'inverter_phase_{phaseAlpha}_voltage_instantaneous_v'
-            data_dict = {'value': phase['VoltageInstantaneousV'],'entity_name': entity_name_temp, 'device_id': id_temp, 'device_type': 'inverter'}
-            self._redback_entities.append(data_dict)
-            entity_name_temp = f'inverter_phase_{phaseAlpha}_current_instantaneous_a'
-            data_dict = {'value': phase['CurrentInstantaneousA'],'entity_name': entity_name_temp, 'device_id': id_temp, 'device_type': 'inverter'}
-            self._redback_entities.append(data_dict)
-            entity_name_temp = f'inverter_phase_{phaseAlpha}_power_factor_instantaneous_minus_1to1'
-            data_dict = {'value': phase['PowerFactorInstantaneousMinus1to1'],'entity_name': entity_name_temp, 'device_id': id_temp, 'device_type': 'inverter'}
-            self._redback_entities.append(data_dict)
-        self._redback_temp_voltage[(data['Data']['Nodes'][0]['StaticData']['Id'])] = round( phase_voltage_sum / phase_count * sqrt(phase_count), 1)
-        data_dict = {'value': round( phase_voltage_sum / phase_count * sqrt(phase_count), 1), 'entity_name': 'inverter_phase_total_voltage_instantaneous_v', 'device_id': id_temp, 'device_type': 'inverter'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': phase_Current_sum, 'entity_name': 'inverter_phase_total_current_instantaneous_a', 'device_id': id_temp, 'device_type': 'inverter'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': phase_power_exported_sum, 'entity_name': 'inverter_phase_total_active_exported_power_instantaneous_kw', 'device_id': id_temp, 'device_type': 'inverter'} 
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': phase_power_imported_sum, 'entity_name': 'inverter_phase_total_active_imported_power_instantaneous_kw', 'device_id': id_temp, 'device_type': 'inverter'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': round(phase_power_net_sum,3), 'entity_name': 'inverter_phase_total_active_net_power_instantaneous_kw', 'device_id': id_temp, 'device_type': 'inverter'}
-        self._redback_entities.append(data_dict)
-        pv_percent = (data2['Data']['PvPowerInstantaneouskW'] / data['Data']['StaticData']['SiteDetails']['PanelSizekW']) * 100
-        data_dict = {'value': round(pv_percent,0), 'entity_name': 'pv_generation_instantaneous_percent_capacity', 'device_id': id_temp, 'device_type': 'inverter'}
-        self._redback_entities.append(data_dict)
-        self._redback_site_load[(data['Data']['Nodes'][0]['StaticData']['Id'])] = phase_power_net_sum + data2['Data']['PvPowerInstantaneouskW']
-        return
+                phase_voltage_sum += voltage
+                phase_Current_sum += current
+                phase_power_exported_sum += exported
+                phase_power_imported_sum += imported
+                phase_power_net_sum += net
+            phase_id = phase['Id']
+            exported_name, imported_name, net_name, voltage_name, current_name, power_factor_name = _PHASE_NAMES.get(phase_id) or _phase_names(phase_id.lower())
+            append_entity({'value': exported,'entity_name': exported_name, 'device_id': id_temp, 'device_type': _INVERTER})
+            append_entity({'value': imported,'entity_name': imported_name, 'device_id': id_temp, 'device_type': _INVERTER})
+            append_entity({'value': net,'entity_name': net_name, 'device_id': id_temp, 'device_type': _INVERTER})
+            append_entity({'value': voltage,'entity_name': voltage_name, 'device_id': id_temp, 'device_type': _INVERTER})
+            append_entity({'value': current,'entity_name': current_name, 'device_id': id_temp, 'device_type': _INVERTER})
+            append_entity({'value': phase['PowerFactorInstantaneousMinus1to1'],'entity_name': power_factor_name, 'device_id': id_temp, 'device_type': _INVERTER})
+        phase_sqrt = _SQRT_PHASES[phase_count] if phase_count < len(_SQRT_PHASES) else sqrt(phase_count)
+        phase_voltage_total = round( phase_voltage_sum / phase_count * phase_sqrt, 1)
+        self._redback_temp_voltage[serial_number] = phase_voltage_total
+        append_entity({'value': phase_voltage_total, 'entity_name': 'inverter_phase_total_voltage_instantaneous_v', 'device_id': id_temp, 'device_type': _INVERTER})
+        append_entity({'value': phase_Current_sum, 'entity_name': 'inverter_phase_total_current_instantaneous_a', 'device_id': id_temp, 'device_type': _INVERTER})
+        append_entity({'value': phase_power_exported_sum, 'entity_name': 'inverter_phase_total_active_exported_power_instantaneous_kw', 'device_id': id_temp, 'device_type': _INVERTER})
+        append_entity({'value': phase_power_imported_sum, 'entity_name': 'inverter_phase_total_active_imported_power_instantaneous_kw', 'device_id': id_temp, 'device_type': _INVERTER})
+        append_entity({'value': round(phase_power_net_sum,3), 'entity_name': 'inverter_phase_total_active_net_power_instantaneous_kw', 'device_id': id_temp, 'device_type': _INVERTER})
+        pv_percent = (dynamic['PvPowerInstantaneouskW'] / site_details['PanelSizekW']) * 100
+        append_entity({'value': round(pv_percent,0), 'entity_name': 'pv_generation_instantaneous_percent_capacity', 'device_id': id_temp, 'device_type': _INVERTER})
+        self._redback_site_load[serial_number] = phase_power_net_sum + dynamic['PvPowerInstantaneouskW']
+        self._redback_entities.extend(entities)
         
-    async def _convert_responses_to_battery_entities(self, data, data2, soc_data) -> None:
+    def _convert_responses_to_battery_entities(self, data, data2, soc_data) -> None:
+        entities = []
+        append_entity = entities.append
         batteryName = 'Unknown'
-        batteryId = 1
-        cabinetId = 1
-        id_temp = data['Data']['Nodes'][0]['StaticData']['Id']
-        id_temp = id_temp[-4:] + 'bat'
-        id_temp = id_temp.lower()
-        data_dict = {'value': (soc_data['Data']['MinSoC0to1'])*100,'entity_name': 'min_soc_0_to_1', 'device_id': id_temp, 'device_type': 'battery'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': (soc_data['Data']['MinOffgridSoC0to1'])*100,'entity_name': 'min_Offgrid_soc_0_to_1', 'device_id': id_temp, 'device_type': 'battery'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data['Data']['StaticData']['Location']['Latitude'],'entity_name': 'latitude', 'device_id': id_temp, 'device_type': 'battery'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data['Data']['StaticData']['Location']['Longitude'],'entity_name': 'longitude', 'device_id': id_temp, 'device_type': 'battery'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data['Data']['StaticData']['SiteDetails']['BatteryMaxChargePowerkW'],'entity_name': 'battery_max_charge_power_kw', 'device_id': id_temp, 'device_type': 'battery'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data['Data']['StaticData']['SiteDetails']['BatteryMaxDischargePowerkW'],'entity_name': 'battery_max_discharge_power_kw', 'device_id': id_temp, 'device_type': 'battery'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data['Data']['StaticData']['SiteDetails']['BatteryCapacitykWh'],'entity_name': 'battery_capacity_kwh', 'device_id': id_temp, 'device_type': 'battery'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data['Data']['StaticData']['SiteDetails']['UsableBatteryCapacitykWh'],'entity_name': 'battery_usable_capacity_kwh', 'device_id': id_temp, 'device_type': 'battery'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data['Data']['StaticData']['SiteDetails']['SystemType'],'entity_name': 'system_type', 'device_id': id_temp, 'device_type': 'battery'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data['Data']['StaticData']['CommissioningDate'],'entity_name': 'commissioning_date', 'device_id': id_temp, 'device_type': 'battery'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data['Data']['StaticData']['Id'],'entity_name': 'site_id', 'device_id': id_temp, 'device_type': 'battery'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data['Data']['StaticData']['Type'],'entity_name': 'inverter_site_type', 'device_id': id_temp, 'device_type': 'battery'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data['Data']['Nodes'][0]['StaticData']['ModelName'],'entity_name': 'model_name', 'device_id': id_temp, 'device_type': 'battery'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data['Data']['Nodes'][0]['StaticData']['BatteryCount'],'entity_name': 'battery_count', 'device_id': id_temp, 'device_type': 'battery'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data['Data']['Nodes'][0]['StaticData']['SoftwareVersion'],'entity_name': 'software_version', 'device_id': id_temp, 'device_type': 'battery'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data['Data']['Nodes'][0]['StaticData']['FirmwareVersion'],'entity_name': 'firmware_version', 'device_id': id_temp, 'device_type': 'battery'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data['Data']['Nodes'][0]['StaticData']['Id'],'entity_name': 'inverter_serial_number', 'device_id': id_temp, 'device_type': 'battery'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': datetime.fromisoformat((data2['Data']['TimestampUtc']).replace('Z','+00:00')),'entity_name': 'timestamp_utc', 'device_id': id_temp, 'device_type': 'inverter'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': (data2['Data']['BatterySoCInstantaneous0to1'])*100,'entity_name': 'battery_soc_instantaneous_0to1', 'device_id': id_temp, 'device_type': 'battery'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data2['Data']['BatteryPowerNegativeIsChargingkW'],'entity_name': 'battery_power_negative_is_charging_kw', 'device_id': id_temp, 'device_type': 'battery'}
-        self._redback_entities.append(data_dict)
-        if data2['Data']['BatteryChargeAllTimeEnergykWh'] is not None:
-            data_dict = {'value': (data2['Data']['BatteryChargeAllTimeEnergykWh'])/1000,'entity_name': 'battery_charge_all_time_energy_mwh', 'device_id': id_temp, 'device_type': 'battery'}
-        else:
-            data_dict = {'value': data2['Data']['BatteryChargeAllTimeEnergykWh'],'entity_name': 'battery_charge_all_time_energy_mwh', 'device_id': id_temp, 'device_type': 'battery'}
-        self._redback_entities.append(data_dict)
-        if data2['Data']['BatteryDischargeAllTimeEnergykWh'] is not None:
-            data_dict = {'value': (data2['Data']['BatteryDischargeAllTimeEnergykWh'])/1000,'entity_name': 'battery_discharge_all_time_energy_mwh', 'device_id': id_temp, 'device_type': 'battery'}
-        else:
-            data_dict = {'value': data2['Data']['BatteryDischargeAllTimeEnergykWh'],'entity_name': 'battery_discharge_all_time_energy_mwh', 'device_id': id_temp, 'device_type': 'battery'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data2['Data']['Status'],'entity_name': 'status', 'device_id': id_temp, 'device_type': 'battery'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data2['Data']['Battery']['CurrentNegativeIsChargingA'],'entity_name': 'battery_current_negative_is_charging_a', 'device_id': id_temp, 'device_type': 'battery'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data2['Data']['Battery']['VoltageV'],'entity_name': 'battery_voltage_v', 'device_id': id_temp, 'device_type': 'battery'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data2['Data']['Battery']['VoltageType'],'entity_name': 'battery_voltage_type', 'device_id': id_temp, 'device_type': 'battery'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value': data2['Data']['Battery']['NumberOfModules'],'entity_name': 'battery_no_of_modules', 'device_id': id_temp, 'device_type': 'battery'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value':(data['Data']['StaticData']['SiteDetails']['BatteryCapacitykWh'] * data2['Data']['BatterySoCInstantaneous0to1'] ),'entity_name': 'battery_currently_stored_kwh', 'device_id': id_temp, 'device_type': 'battery'}
-        self._redback_entities.append(data_dict)
-        data_dict = {'value':  round(data['Data']['StaticData']['SiteDetails']['BatteryCapacitykWh'] * (data2['Data']['BatterySoCInstantaneous0to1']- soc_data['Data']['MinSoC0to1']),2),'entity_name': 'battery_currently_usable_kwh', 'device_id': id_temp, 'device_type': 'battery'}
-        self._redback_entities.append(data_dict)
+        node_static = data['Data']['Nodes'][0]['StaticData']
+        site_static = data['Data']['StaticData']
+        site_details = site_static['SiteDetails']
+        location = site_static['Location']
+        dynamic = data2['Data']
+        battery_data = dynamic['Battery']
+        soc = soc_data['Data']
+        serial_number = node_static['Id']
+        id_temp = self._device_id(serial_number, 'bat')
+        append_entity({'value': (soc['MinSoC0to1'])*100,'entity_name': 'min_soc_0_to_1', 'device_id': id_temp, 'device_type': _BATTERY})
+        append_entity({'value': (soc['MinOffgridSoC0to1'])*100,'entity_name': 'min_Offgrid_soc_0_to_1', 'device_id': id_temp, 'device_type': _BATTERY})
+        sections = {'node': node_static, 'site': site_static, 'details': site_details, 'location': location, 'dynamic': dynamic, 'battery': battery_data}
+        entities.extend(self._static_entities_for(id_temp, data, sections, _BATTERY, (), _BATTERY_STATIC_SPECS))
+        append_entity({'value': datetime.fromisoformat((dynamic['TimestampUtc']).replace('Z','+00:00')),'entity_name': 'timestamp_utc', 'device_id': id_temp, 'device_type': _INVERTER})
+        append_entity({'value': (dynamic['BatterySoCInstantaneous0to1'])*100,'entity_name': 'battery_soc_instantaneous_0to1', 'device_id': id_temp, 'device_type': _BATTERY})
+        append_entity({'value': dynamic['BatteryPowerNegativeIsChargingkW'],'entity_name': 'battery_power_negative_is_charging_kw', 'device_id': id_temp, 'device_type': _BATTERY})
+        for key, entity_name in _BATTERY_ALLTIME_SPECS:
+            value = dynamic[key]
+            append_entity({'value': value/1000 if value is not None else None,'entity_name': entity_name, 'device_id': id_temp, 'device_type': _BATTERY})
+        entities.extend({'value': sections[section][key], 'entity_name': entity_name, 'device_id': id_temp, 'device_type': _BATTERY} for entity_name, section, key in _BATTERY_DYNAMIC_SPECS)
+        append_entity({'value':(site_details['BatteryCapacitykWh'] * dynamic['BatterySoCInstantaneous0to1'] ),'entity_name': 'battery_currently_stored_kwh', 'device_id': id_temp, 'device_type': _BATTERY})
+        append_entity({'value':  round(site_details['BatteryCapacitykWh'] * (dynamic['BatterySoCInstantaneous0to1']- soc['MinSoC0to1']),2),'entity_name': 'battery_currently_usable_kwh', 'device_id': id_temp, 'device_type': _BATTERY})
         battery_current_a = 0
         battery_power_kw = 0
-        for battery in data['Data']['Nodes'][0]['StaticData']['BatteryModels']:
+        for batteryId, (battery, battery_module) in enumerate(zip(node_static['BatteryModels'], battery_data['Modules']), 1):
             if battery != 'Unknown':
                 batteryName = battery
-                data_dict = {'value': batteryName,'entity_name': f'battery_{batteryId}_model', 'device_id': id_temp, 'device_type': 'battery'}
-                self._redback_entities.append(data_dict)
-            else:
-                data_dict = {'value': batteryName,'entity_name': f'battery_{batteryId}_model', 'device_id': id_temp, 'device_type': 'battery'}
-                self._redback_entities.append(data_dict)
-            battery_temp_value = data2['Data']['Battery']['Modules'][batteryId-1]['CurrentNegativeIsChargingA']
+            append_entity({'value': batteryName,'entity_name': f'battery_{batteryId}_model', 'device_id': id_temp, 'device_type': _BATTERY})
+            battery_temp_value = battery_module['CurrentNegativeIsChargingA']
             battery_current_a += battery_temp_value
-            battery_temp_name= f'battery_{batteryId}_current_negative_is_charging_a'
-            data_dict = {'value': battery_temp_value,'entity_name': battery_temp_name, 'device_id': id_temp, 'device_type': 'battery'}
-            self._redback_entities.append(data_dict)
-            battery_temp_value = data2['Data']['Battery']['Modules'][batteryId-1]['VoltageV']
-            battery_temp_name= f'battery_{batteryId}_voltage_v'
-            data_dict = {'value': battery_temp_value,'entity_name': battery_temp_name, 'device_id': id_temp, 'device_type': 'battery'}
-            self._redback_entities.append(data_dict)
-            battery_temp_value = data2['Data']['Battery']['Modules'][batteryId-1]['PowerNegativeIsChargingkW']
+            append_entity({'value': battery_temp_value,'entity_name': f'battery_{batteryId}_current_negative_is_charging_a', 'device_id': id_temp, 'device_type': _BATTERY})
+            append_entity({'value': battery_module['VoltageV'],'entity_name': f'battery_{batteryId}_voltage_v', 'device_id': id_temp, 'device_type': _BATTERY})
+            battery_temp_value = battery_module['PowerNegativeIsChargingkW']
             battery_power_kw += battery_temp_value
-            battery_temp_name= f'battery_{batteryId}_power_negative_is_charging_kw'
-            data_dict = {'value': battery_temp_value,'entity_name': battery_temp_name, 'device_id': id_temp, 'device_type': 'battery'}
-            self._redback_entities.append(data_dict)
-            battery_temp_value = (data2['Data']['Battery']['Modules'][batteryId-1]['SoC0To1'])*100
-            battery_temp_name= f'battery_{batteryId}_soc_0to1'
-            data_dict = {'value': battery_temp_value,'entity_name': battery_temp_name, 'device_id': id_temp, 'device_type': 'battery'}
-            self._redback_entities.append(data_dict)
-            batteryId += 1
-        data_dict = {'value': round(data2['Data']['BatteryPowerNegativeIsChargingkW']*1000/self._redback_temp_voltage[(data['Data']['Nodes'][0]['StaticData']['Id'])],1),'entity_name': 'battery_current_negative_is_charging_a', 'device_id': id_temp, 'device_type': 'battery'}
-        self._redback_entities.append(data_dict)
-        for cabinet in data2['Data']['Battery']['Cabinets']:
-            cabinet_temp_name = f'battery_cabinet_{cabinetId}_temperature_c'
-            data_dict = {'value': cabinet['TemperatureC'],'entity_name': cabinet_temp_name, 'device_id': id_temp, 'device_type': 'battery'}
-            self._redback_entities.append(data_dict)
-            cabinet_temp_name = f'battery_cabinet_{cabinetId}_fan_state'
-            data_dict = {'value': cabinet['FanState'],'entity_name': cabinet_temp_name, 'device_id': id_temp, 'device_type': 'battery'}
-            self._redback_entities.append(data_dict)
-            cabinetId += 1
-        self._redback_site_load[(data['Data']['Nodes'][0]['StaticData']['Id'])] += data2['Data']['BatteryPowerNegativeIsChargingkW']
-        return
-
-    async def _add_additional_entities(self, site_load_data, data):
-        id_temp = data['Data']['Nodes'][0]['StaticData']['Id']
-        id_temp = id_temp[-4:] + 'inv'
-        id_temp = id_temp.lower()
-        value_temp= round(site_load_data,3)
-        data_dict = {'value': value_temp,'entity_name': 'inverter_site_load_instantaneous_kw', 'device_id': id_temp, 'device_type': 'inverter'}
-        self._redback_entities.append(data_dict)
-        return
-
-    async def _create_op_env_active_entities(self, data, device_id, site):
+            append_entity({'value': battery_temp_value,'entity_name': f'battery_{batteryId}_power_negative_is_charging_kw', 'device_id': id_temp, 'device_type': _BATTERY})
+            append_entity({'value': (battery_module['SoC0To1'])*100,'entity_name': f'battery_{batteryId}_soc_0to1', 'device_id': id_temp, 'device_type': _BATTERY})
+        append_entity({'value': round(dynamic['BatteryPowerNegativeIsChargingkW']*1000/self._redback_temp_voltage[serial_number],1),'entity_name': 'battery_current_negative_is_charging_a', 'device_id': id_temp, 'device_type': _BATTERY})
+        entities.extend(cabinet_entities(battery_data['Cabinets'], id_temp, _BATTERY))
+        self._redback_site_load[serial_number] += dynamic['BatteryPowerNegativeIsChargingkW']
+        self._redback_entities.extend(entities)
+
+    def _add_additional_entities(self, site_load_data, data):
+        id_temp = self._device_id(data['Data']['Nodes'][0]['StaticData']['Id'], 'inv')
+        self._redback_entities.append(site_load_entity(site_load_data, id_temp, _INVERTER))
+
+    def _create_op_env_active_entities(self, data, device_id, site):
+        self._redback_entities.append({'value': self._redback_op_env_active[site], 'entity_name': 'op_env_active_now', 'device_id': device_id, 'device_type': 'OperatingEnvelope', 'type_set': 'sensor.string' })
         if data is None:
-            data_dict = {'value': self._redback_op_env_active[site], 'entity_name': 'op_env_active_now', 'device_id': device_id, 'device_type': 'OperatingEnvelope', 'type_set': 'sensor.string' }
-            self._redback_entities.append(data_dict)
-            data_dict = {'value': 'No Active Event','entity_name': 'op_env_active_event_id', 'device_id': device_id, 'device_type': 'OperatingEnvelope', 'type_set': 'sensor.string' }
-            self._redback_entities.append(data_dict)
-            data_dict = {'value': None,'entity_name': 'op_env_active_nmi', 'device_id': device_id, 'device_type': 'OperatingEnvelope', 'type_set': 'sensor.string' }
-            self._redback_entities.append(data_dict)
-            data_dict = {'value': None,'entity_name': 'op_env_active_site_id', 'device_id': device_id, 'device_type': 'OperatingEnvelope', 'type_set': 'sensor.string' }
-            self._redback_entities.append(data_dict)
-            data_dict = {'value': None,'entity_name': 'op_env_active_start_datetime', 'device_id': device_id, 'device_type': 'OperatingEnvelope', 'type_set': 'sensor.datetime' }
-            self._redback_entities.append(data_dict)
-            data_dict = {'value': None,'entity_name': 'op_env_active_end_datetime', 'device_id': device_id, 'device_type': 'OperatingEnvelope', 'type_set': 'sensor.datetime' }
-            self._redback_entities.append(data_dict)
-            data_dict = {'value': 0,'entity_name': 'op_env_active_max_import_power_w', 'device_id': device_id, 'device_type': 'OperatingEnvelope', 'type_set': 'sensor.integer' }
-            self._redback_entities.append(data_dict)
-            data_dict = {'value': 0,'entity_name': 'op_env_active_max_export_power_w', 'device_id': device_id, 'device_type': 'OperatingEnvelope', 'type_set': 'sensor.integer' }
-            self._redback_entities.append(data_dict)
-            data_dict = {'value': 0,'entity_name': 'op_env_active_max_discharge_power_w', 'device_id': device_id, 'device_type': 'OperatingEnvelope', 'type_set': 'sensor.integer' }
-            self._redback_entities.append(data_dict)
-            data_dict = {'value': 0,'entity_name': 'op_env_active_max_charge_power_w', 'device_id': device_id, 'device_type': 'OperatingEnvelope', 'type_set': 'sensor.integer' }
-            self._redback_entities.append(data_dict)
-            data_dict = {'value': 0,'entity_name': 'op_env_active_max_generation_power_va', 'device_id': device_id, 'device_type': 'OperatingEnvelope', 'type_set': 'sensor.integer' }
-            self._redback_entities.append(data_dict)
-            data_dict = {'value': None,'entity_name': 'op_env_active_is_network_level', 'device_id': device_id, 'device_type': 'OperatingEnvelope', 'type_set': 'sensor.boolean' }
-            self._redback_entities.append(data_dict)
-            data_dict = {'value': None,'entity_name': 'op_env_active_reported_start_datetime', 'device_id': device_id, 'device_type': 'OperatingEnvelope', 'type_set': 'sensor.datetime' }
-            self._redback_entities.append(data_dict)
-            data_dict = {'value': None,'entity_name': 'op_env_active_reported_finished_datetime', 'device_id': device_id, 'device_type': 'OperatingEnvelope', 'type_set': 'sensor.datetime' }
-            self._redback_entities.append(data_dict)
-            data_dict = {'value': None,'entity_name': 'op_env_active_status', 'device_id': device_id, 'device_type': 'OperatingEnvelope', 'type_set': 'sensor.string' }
-            self._redback_entities.append(data_dict)
+            self._redback_entities.extend({'value': default, 'entity_name': entity_name, 'device_id': device_id, 'device_type': 'OperatingEnvelope', 'type_set': type_set} for entity_name, _, type_set, default in _OP_ENV_ACTIVE_SPECS)
         else:
-            data_dict = {'value': self._redback_op_env_active[site], 'entity_name': 'op_env_active_now', 'device_id': device_id, 'device_type': 'OperatingEnvelope', 'type_set': 'sensor.string' }
-            self._redback_entities.append(data_dict)
-            data_dict = {'value': data['EventId'],'entity_name': 'op_env_active_event_id', 'device_id': device_id, 'device_type': 'OperatingEnvelope', 'type_set': 'sensor.string' }
-            self._redback_entities.append(data_dict)
-            data_dict = {'value': data['Nmi'],'entity_name': 'op_env_active_nmi', 'device_id': device_id, 'device_type': 'OperatingEnvelope', 'type_set': 'sensor.string' }
-            self._redback_entities.append(data_dict)
-            data_dict = {'value': data['SiteId'],'entity_name': 'op_env_active_site_id', 'device_id': device_id, 'device_type': 'OperatingEnvelope', 'type_set': 'sensor.string' }
-            self._redback_entities.append(data_dict)
-            data_dict = {'value': data['StartAtUtc'],'entity_name': 'op_env_active_start_datetime', 'device_id': device_id, 'device_type': 'OperatingEnvelope', 'type_set': 'sensor.datetime' }
-            self._redback_entities.append(data_dict)
-            data_dict = {'value': data['EndAtUtc'],'entity_name': 'op_env_active_end_datetime', 'device_id': device_id, 'device_type': 'OperatingEnvelope', 'type_set': 'sensor.datetime' }
-            self._redback_entities.append(data_dict)
-            data_dict = {'value': data['MaxImportPowerW'],'entity_name': 'op_env_active_max_import_power_w', 'device_id': device_id, 'device_type': 'OperatingEnvelope', 'type_set': 'sensor.integer' }
-            self._redback_entities.append(data_dict)
-            data_dict = {'value': data['MaxExportPowerW'],'entity_name': 'op_env_active_max_export_power_w', 'device_id': device_id, 'device_type': 'OperatingEnvelope', 'type_set': 'sensor.integer' }
-            self._redback_entities.append(data_dict)
-            data_dict = {'value': data['MaxDischargePowerW'],'entity_name': 'op_env_active_max_discharge_power_w', 'device_id': device_id, 'device_type': 'OperatingEnvelope', 'type_set': 'sensor.integer' }
-            self._redback_entities.append(data_dict)
-            data_dict = {'value': data['MaxChargePowerW'],'entity_name': 'op_env_active_max_charge_power_w', 'device_id': device_id, 'device_type': 'OperatingEnvelope', 'type_set': 'sensor.integer' }
-            self._redback_entities.append(data_dict)
-            data_dict = {'value': data['MaxGenerationPowerVA'],'entity_name': 'op_env_active_max_generation_power_va', 'device_id': device_id, 'device_type': 'OperatingEnvelope', 'type_set': 'sensor.integer' }
-            self._redback_entities.append(data_dict)
-            data_dict = {'value': data['IsNetworkLevel'],'entity_name': 'op_env_active_is_network_level', 'device_id': device_id, 'device_type': 'OperatingEnvelope', 'type_set': 'sensor.boolean' }
-            self._redback_entities.append(data_dict)
-            data_dict = {'value': data['ReportedStartUtc'],'entity_name': 'op_env_active_reported_start_datetime', 'device_id': device_id, 'device_type': 'OperatingEnvelope', 'type_set': 'sensor.datetime' }
-            self._redback_entities.append(data_dict)
-            data_dict = {'value': data['ReportedFinishUtc'],'entity_name': 'op_env_active_reported_finished_datetime', 'device_id': device_id, 'device_type': 'OperatingEnvelope', 'type_set': 'sensor.datetime' }
-            self._redback_entities.append(data_dict)
-            data_dict = {'value': data['Status'],'entity_name': 'op_env_active_status', 'device_id': device_id, 'device_type': 'OperatingEnvelope', 'type_set': 'sensor.string' }
-            self._redback_entities.append(data_dict)
-        return
+            self._redback_entities.extend({'value': data[key], 'entity_name': entity_name, 'device_id': device_id, 'device_type': 'OperatingEnvelope', 'type_set': type_set} for entity_name, key, type_set, _ in _OP_ENV_ACTIVE_SPECS)
 
-    async def _add_selected_schedule(self, data):
-        id_temp = data['Data']['Nodes'][0]['StaticData']['Id']
-        id_temp = id_temp[-4:] + 'inv'
-        id_temp = id_temp.lower()
-        if self._redback_schedule_selected[id_temp]['schedule_selector'] is not None:
+    def _add_selected_schedule(self, data):
+        id_temp = self._device_id(data['Data']['Nodes'][0]['StaticData']['Id'], 'inv')
+        schedule_selector = self._redback_schedule_selected[id_temp]['schedule_selector']
+        if schedule_selector is not None:
             #add schedule to entities
-            for schedule in self._redback_schedules:
-                if schedule['schedule_selector'] == self._redback_schedule_selected[id_temp]['schedule_selector']:
-                    data_dict = {'value': schedule['start_time_utc'],'entity_name': 'scheduled_start_time', 'device_id': id_temp, 'device_type': 'inverter'}
-                    self._redback_entities.append(data_dict)
-                    data_dict = {'value': schedule['end_time'],'entity_name': 'scheduled_finish_time', 'device_id': id_temp, 'device_type': 'inverter'}
-                    self._redback_entities.append(data_dict)
-                    data_dict = {'value': schedule['duration'],'entity_name': 'scheduled_duration', 'device_id': id_temp, 'device_type': 'inverter'}
-                    self._redback_entities.append(data_dict)
-                    data_dict = {'value': schedule['power_w'],'entity_name': 'scheduled_power_w', 'device_id': id_temp, 'device_type': 'inverter'}
-                    self._redback_entities.append(data_dict)
-                    data_dict = {'value': schedule['inverter_mode'],'entity_name': 'scheduled_inverter_mode', 'device_id': id_temp, 'device_type': 'inverter'}
-                    self._redback_entities.append(data_dict)
+            schedule = self._schedules_by_selector.get(schedule_selector)
+            if schedule is not None:
+                self._redback_entities.extend({'value': schedule[key],'entity_name': entity_name, 'device_id': id_temp, 'device_type': _INVERTER} for entity_name, key, _ in _SELECTED_SCHEDULE_SPECS)
         else:
-            data_dict = {'value': None,'entity_name': 'scheduled_start_time', 'device_id': id_temp, 'device_type': 'inverter'}
-            self._redback_entities.append(data_dict)
-            data_dict = {'value': None,'entity_name': 'scheduled_finish_time', 'device_id': id_temp, 'device_type': 'inverter'}
-            self._redback_entities.append(data_dict)
-            data_dict = {'value': 0,'entity_name': 'scheduled_duration', 'device_id': id_temp, 'device_type': 'inverter'}
-            self._redback_entities.append(data_dict)
-            data_dict = {'value': 0,'entity_name': 'scheduled_power_w', 'device_id': id_temp, 'device_type': 'inverter'}
-            self._redback_entities.append(data_dict)
-            data_dict = {'value': 'ChargeBattery','entity_name': 'scheduled_inverter_mode', 'device_id': id_temp, 'device_type': 'inverter'}
-            self._redback_entities.append(data_dict)
-        return
+            self._redback_entities.extend({'value': default,'entity_name': entity_name, 'device_id': id_temp, 'device_type': _INVERTER} for entity_name, _, default in _SELECTED_SCHEDULE_SPECS)
 
-    async def _add_selected_op_env_entities(self, site, device_id):
+    def _add_selected_op_env_entities(self, site, device_id):
         """add selected operating envelope to entities"""
-        if self._redback_op_env_selected[device_id]['schedule_selector'] is not None:
+        schedule_selector = self._redback_op_env_selected[device_id]['schedule_selector']
+        if schedule_selector is not None:
             #add op_env to entities
             for op_env in self._redback_open_env_data:
-                if op_env['data']['schedule_selector'] == self._redback_op_env_selected[device_id]['schedule_selector']:
-                    data_dict = {'value': op_env['data']['StartAtUtc'],'entity_name': 'op_env_selected_start_time', 'device_id': device_id, 'device_type': 'OperationEnvelope'}
-                    self._redback_entities.append(data_dict)
-                    data_dict = {'value': op_env['data']['EndAtUtc'],'entity_name': 'op_env_selected_end_time', 'device_id': device_id, 'device_type': 'OperationEnvelope'}
-                    self._redback_entities.append(data_dict)
-                    data_dict = {'value': op_env['data']['EventId'],'entity_name': 'op_env_selected_event_id', 'device_id': device_id, 'device_type': 'OperationEnvelope'}
-                    self._redback_entities.append(data_dict)
-                    data_dict = {'value': op_env['data']['Nmi'],'entity_name': 'op_env_selected_nmi', 'device_id': device_id, 'device_type': 'OperationEnvelope'}
-                    self._redback_entities.append(data_dict)
-                    data_dict = {'value': op_env['data']['SiteId'],'entity_name': 'op_env_selected_site_id', 'device_id': device_id, 'device_type': 'OperationEnvelope'}
-                    self._redback_entities.append(data_dict)
-                    data_dict = {'value': op_env['data']['MaxImportPowerW'],'entity_name': 'op_env_selected_max_import_power_w', 'device_id': device_id, 'device_type': 'OperationEnvelope'}
-                    self._redback_entities.append(data_dict)
-                    data_dict = {'value': op_env['data']['MaxExportPowerW'],'entity_name': 'op_env_selected_max_export_power_w', 'device_id': device_id, 'device_type': 'OperationEnvelope'}
-                    self._redback_entities.append(data_dict)
-                    data_dict = {'value': op_env['data']['MaxDischargePowerW'],'entity_name': 'op_env_selected_max_discharge_power_w', 'device_id': device_id, 'device_type': 'OperationEnvelope'}
-                    self._redback_entities.append(data_dict)
-                    data_dict = {'value': op_env['data']['MaxChargePowerW'],'entity_name': 'op_env_selected_max_charge_power_w', 'device_id': device_id, 'device_type': 'OperationEnvelope'}
-                    self._redback_entities.append(data_dict)
-                    data_dict = {'value': op_env['data']['MaxGenerationPowerVA'],'entity_name': 'op_env_selected_max_generation_power_va', 'device_id': device_id, 'device_type': 'OperationEnvelope'}
-                    self._redback_entities.append(data_dict)
-                    data_dict = {'value': op_env['data']['Status'],'entity_name': 'op_env_selected_status', 'device_id': device_id, 'device_type': 'OperationEnvelope'}
-                    self._redback_entities.append(data_dict)
-                    data_dict = {'value': op_env['data']['schedule_selector'],'entity_name': 'op_env_selected_schedule_selector', 'device_id': device_id, 'device_type': 'OperationEnvelope'}
-                    self._redback_entities.append(data_dict)
+                op_env_data = op_env['data']
+                if op_env_data['schedule_selector'] == schedule_selector:
+                    self._redback_entities.extend({'value': op_env_data[key], 'entity_name': entity_name, 'device_id': device_id, 'device_type': 'OperationEnvelope'} for entity_name, key, _ in _SELECTED_OP_ENV_SPECS)
         else:
-            data_dict = {'value': None,'entity_name': 'op_env_selected_start_time', 'device_id': device_id, 'device_type': 'OperationEnvelope'}
-            self._redback_entities.append(data_dict)
-            data_dict = {'value': None,'entity_name': 'op_env_selected_end_time', 'device_id': device_id, 'device_type': 'OperationEnvelope'}
-            self._redback_entities.append(data_dict)
-            data_dict = {'value': '','entity_name': 'op_env_selected_event_id', 'device_id': device_id, 'device_type': 'OperationEnvelope'}
-            self._redback_entities.append(data_dict)
-            data_dict = {'value': '','entity_name': 'op_env_selected_nmi', 'device_id': device_id, 'device_type': 'OperationEnvelope'}
-            self._redback_entities.append(data_dict)
-            data_dict = {'value': '','entity_name': 'op_env_selected_site_id', 'device_id': device_id, 'device_type': 'OperationEnvelope'}
-            self._redback_entities.append(data_dict)
-            data_dict = {'value': 0,'entity_name': 'op_env_selected_max_import_power_w', 'device_id': device_id, 'device_type': 'OperationEnvelope'}
-            self._redback_entities.append(data_dict)
-            data_dict = {'value': 0,'entity_name': 'op_env_selected_max_export_power_w', 'device_id': device_id, 'device_type': 'OperationEnvelope'}
-            self._redback_entities.append(data_dict)
-            data_dict = {'value': 0,'entity_name': 'op_env_selected_max_discharge_power_w', 'device_id': device_id, 'device_type': 'OperationEnvelope'}
-            self._redback_entities.append(data_dict)
-            data_dict = {'value': 0,'entity_name': 'op_env_selected_max_charge_power_w', 'device_id': device_id, 'device_type': 'OperationEnvelope'}
-            self._redback_entities.append(data_dict)
-            data_dict = {'value': 0,'entity_name': 'op_env_selected_max_generation_power_va', 'device_id': device_id, 'device_type': 'OperationEnvelope'}
-            self._redback_entities.append(data_dict)
-            data_dict = {'value': '','entity_name': 'op_env_selected_status', 'device_id': device_id, 'device_type': 'OperationEnvelope'}
-            self._redback_entities.append(data_dict)
-            data_dict = {'value': None,'entity_name': 'op_env_selected_schedule_selector', 'device_id': device_id, 'device_type': 'OperationEnvelope'}
-            self._redback_entities.append(data_dict)
-        return
\ No newline at end of file
+            self._redback_entities.extend({'value': default, 'entity_name': entity_name, 'device_id': device_id, 'device_type': 'OperationEnvelope'} for entity_name, _, default in _SELECTED_OP_ENV_SPECS)
\ No newline at end of file